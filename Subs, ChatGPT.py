@@ -15,7 +15,7 @@ from dataclasses import dataclass
 from typing import List, Optional, Tuple
 
 from PyQt6.QtCore import Qt, QThread, pyqtSignal
-from PyQt6.QtGui import QAction, QIcon, QPalette, QColor
+from PyQt6.QtGui import QAction, QIcon
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QFileDialog, QTabWidget, QVBoxLayout,
     QHBoxLayout, QLabel, QLineEdit, QPushButton, QTableWidget, QTableWidgetItem,
@@ -638,23 +638,14 @@ class MainWindow(QMainWindow):
         ))
 
     def _apply_dark_theme(self):
-        palette = QPalette()
-        palette.setColor(QPalette.ColorRole.Window, QColor(30, 32, 34))
-        palette.setColor(QPalette.ColorRole.WindowText, QColor(230, 230, 230))
-        palette.setColor(QPalette.ColorRole.Base, QColor(24, 26, 27))
-        palette.setColor(QPalette.ColorRole.AlternateBase, QColor(36, 38, 40))
-        palette.setColor(QPalette.ColorRole.ToolTipBase, QColor(255, 255, 220))
-        palette.setColor(QPalette.ColorRole.ToolTipText, QColor(0, 0, 0))
-        palette.setColor(QPalette.ColorRole.Text, QColor(230, 230, 230))
-        palette.setColor(QPalette.ColorRole.Button, QColor(45, 47, 50))
-        palette.setColor(QPalette.ColorRole.ButtonText, QColor(230, 230, 230))
-        palette.setColor(QPalette.ColorRole.BrightText, QColor(255, 0, 0))
-        palette.setColor(QPalette.ColorRole.Highlight, QColor(64, 128, 255))
-        palette.setColor(QPalette.ColorRole.HighlightedText, QColor(255, 255, 255))
-        self.setPalette(palette)
+        # Tudo num único stylesheet: um polish só, sem QPalette à parte
         self.setStyleSheet("""
-            QWidget { font-size: 12px; }
+            QWidget { font-size: 12px; background: #1e2022; color: #e6e6e6;
+                      selection-background-color: #4080ff; selection-color: #ffffff; }
+            QLineEdit, QComboBox, QTextEdit, QPlainTextEdit, QListWidget, QTableWidget {
+                background: #181a1b; color: #e6e6e6; alternate-background-color: #242628; }
             QLineEdit, QComboBox { padding: 6px; border: 1px solid #555; border-radius: 6px; }
+            QToolTip { background: #ffffdc; color: #000000; }
             QPushButton { padding: 8px 12px; border-radius: 8px; background: #3b82f6; color: white; }
             QPushButton:hover { background: #2563eb; }
             QTableWidget { gridline-color: #444; }
@@ -7,7 +7,19 @@
 # https://gemini.google.com/app/6808289df3c430a3
 
 import os
-import chardet
+import codecs
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+# Detector de codificação: cchardet (C, bem mais rápido) quando disponível,
+# senão charset_normalizer; chardet fica como último recurso. Todos expõem
+# detect(bytes) -> {'encoding': ...}.
+try:
+    import cchardet as _cd
+except ImportError:
+    try:
+        import charset_normalizer as _cd
+    except ImportError:
+        import chardet as _cd
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QPushButton,
     QLabel, QLineEdit, QFileDialog, QTextEdit,
@@ -16,6 +28,100 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt
 
+# Bytes iniciais usados na detecção de codificação (a confiança estabiliza bem antes disso)
+DETECT_WINDOW = 4096
+BLOCO_IO = 1 << 16  # leitura/escrita em blocos de 64 KiB
+# Tentativas quando a detecção falha, em ordem (latin1 aceita qualquer byte, por isso vem por último).
+# utf-16 fica de fora: decodifica quase qualquer sequência de tamanho par e mascararia o latin1;
+# UTF-16 de verdade já é reconhecido pelo BOM em _sniff_encoding
+CODIFICACOES_FALLBACK = ('utf-8', 'cp1252', 'latin1')
+
+def _sniff_encoding(raw):
+    """Identifica BOM ou ASCII puro sem rodar o detector; None se inconclusivo."""
+    if raw.startswith(b'\xef\xbb\xbf'):
+        return 'utf-8-sig'
+    if raw[:2] in (b'\xff\xfe', b'\xfe\xff'):
+        return 'utf-16'
+    if raw.isascii():
+        return 'ascii'
+    return None
+
+
+# Probers usados quando o detector é o chardet puro (cchardet e charset_normalizer
+# ignoram). Por padrão só alfabeto latino; acrescente 'cyrillic', 'greek',
+# 'single-byte' (todos os de 1 byte) ou 'cjk' para legendas em outras línguas.
+ENABLED_PROBERS = ['utf-8', 'latin-1']
+
+# Um UniversalDetector por thread, reiniciado a cada arquivo em vez de recriado
+# (charset_normalizer não tem detector incremental e segue com detect())
+_UniversalDetector = getattr(_cd, 'UniversalDetector', None)
+if _cd.__name__ == 'chardet':
+    # A troca de probers usa internos do chardet (módulos dos probers e a lista
+    # _charset_probers); se não existirem nesta versão, fica o detector padrão
+    try:
+        from chardet.charsetgroupprober import CharSetGroupProber
+        from chardet.latin1prober import Latin1Prober
+        from chardet.mbcsgroupprober import MBCSGroupProber
+        from chardet.sbcharsetprober import SingleByteCharSetProber
+        from chardet.sbcsgroupprober import SBCSGroupProber
+        from chardet.utf8prober import UTF8Prober
+        from chardet import langgreekmodel, langrussianmodel
+    except ImportError:
+        pass
+    else:
+        def _grupo_probers(*modelos):
+            grupo = CharSetGroupProber()
+            grupo.probers = [SingleByteCharSetProber(m) for m in modelos]
+            grupo.reset()
+            return grupo
+
+        _PROBERS = {
+            'utf-8': UTF8Prober,
+            'latin-1': Latin1Prober,  # cobre cp1252 / iso-8859-1 / iso-8859-15
+            'cyrillic': lambda: _grupo_probers(
+                langrussianmodel.WINDOWS_1251_RUSSIAN_MODEL, langrussianmodel.KOI8_R_RUSSIAN_MODEL,
+                langrussianmodel.ISO_8859_5_RUSSIAN_MODEL, langrussianmodel.IBM866_RUSSIAN_MODEL),
+            'greek': lambda: _grupo_probers(
+                langgreekmodel.WINDOWS_1253_GREEK_MODEL, langgreekmodel.ISO_8859_7_GREEK_MODEL),
+            'single-byte': SBCSGroupProber,
+            'cjk': MBCSGroupProber,
+        }
+
+        class _DetectorLatino(_cd.UniversalDetector):
+            def __init__(self):
+                super().__init__()
+                # Com a lista já preenchida o feed() do chardet não monta a padrão (com todas as línguas)
+                self._charset_probers = [_PROBERS[nome]() for nome in ENABLED_PROBERS]
+
+        def _probers_sobrevivem_reset():
+            """True se esta versão do chardet guarda _charset_probers e o reset() a preserva."""
+            try:
+                det = _DetectorLatino()
+                det.reset()
+                return len(getattr(det, '_charset_probers', ())) == len(ENABLED_PROBERS)
+            except Exception:
+                return False
+
+        if _probers_sobrevivem_reset():
+            _UniversalDetector = _DetectorLatino
+_detector_local = threading.local()
+
+def _detect(raw):
+    """Detecta a codificação de raw alimentando o detector em blocos de 1 KiB."""
+    if _UniversalDetector is None:
+        return _cd.detect(raw)['encoding']
+    det = getattr(_detector_local, 'det', None)
+    if det is None:
+        det = _detector_local.det = _UniversalDetector()
+    det.reset()
+    for i in range(0, len(raw), 1024):
+        det.feed(raw[i:i + 1024])
+        if det.done:
+            break
+    det.close()
+    return det.result['encoding']
+
+
 class ConversorLegendas(QWidget):
     def __init__(self):
         super().__init__()
@@ -116,9 +222,10 @@ class ConversorLegendas(QWidget):
 
     def atualizar_lista_arquivos(self, pasta):
         self.list_arquivos.clear()
-        for nome_arquivo in os.listdir(pasta):
-            if nome_arquivo.lower().endswith('.srt') and os.path.isfile(os.path.join(pasta, nome_arquivo)):
-                self.list_arquivos.addItem(nome_arquivo)
+        # scandir reaproveita o tipo vindo da listagem; um único addItems para a lista
+        with os.scandir(pasta) as entradas:
+            self.list_arquivos.addItems([e.name for e in entradas
+                                         if e.name.lower().endswith('.srt') and e.is_file()])
 
     def iniciar_conversao(self):
         pasta_entrada = self.input_dir.text()
@@ -140,59 +247,84 @@ class ConversorLegendas(QWidget):
         self.log_area.append('\n✅ Processo de conversão concluído!')
 
     def processar_arquivos(self, pasta_entrada, pasta_saida, codificacao_destino):
-        for i in range(self.list_arquivos.count()):
-            nome_arquivo = self.list_arquivos.item(i).text()
-            caminho_completo_entrada = os.path.join(pasta_entrada, nome_arquivo)
-            caminho_completo_saida = os.path.join(pasta_saida if pasta_saida else pasta_entrada, nome_arquivo)
+        # Arquivos independentes: converte em paralelo e junta o log na thread da UI
+        nomes = [self.list_arquivos.item(i).text() for i in range(self.list_arquivos.count())]
+        max_workers = min(8, os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futuros = [pool.submit(self.converter_arquivo, nome, pasta_entrada, pasta_saida, codificacao_destino)
+                       for nome in nomes]
+            for futuro in as_completed(futuros):
+                # Um append por arquivo em vez de um por linha
+                self.log_area.append("\n".join(futuro.result()))
 
-            codificacao_origem = None
-            conteudo_texto = None
+    def converter_arquivo(self, nome_arquivo, pasta_entrada, pasta_saida, codificacao_destino):
+        """Converte um arquivo (roda numa thread do pool); devolve as linhas de log."""
+        log = []
+        caminho_completo_entrada = os.path.join(pasta_entrada, nome_arquivo)
+        caminho_completo_saida = os.path.join(pasta_saida if pasta_saida else pasta_entrada, nome_arquivo)
 
-            try:
-                # Ler o arquivo em modo binário para detecção
+        try:
+            # Só o início do arquivo é lido para a detecção
+            with open(caminho_completo_entrada, 'rb') as f_bin:
+                cabecalho = f_bin.read(DETECT_WINDOW)
+
+            # BOM/ASCII resolvem sem detector; senão, detecção automática
+            codificacao_origem = _sniff_encoding(cabecalho)
+            if codificacao_origem is None:
+                codificacao_origem = _detect(cabecalho)
+
+            cabecalho_ascii = bool(codificacao_origem) and codificacao_origem.lower() == 'ascii'
+            if cabecalho_ascii:
+                if len(cabecalho) < DETECT_WINDOW:
+                    # O arquivo inteiro coube na janela e é ASCII: utf-8 decodifica igual
+                    codificacao_origem = 'utf-8'
+                    cabecalho_ascii = False
+                else:
+                    # Cabeçalho ASCII não diz nada sobre os acentos mais adiante (cp1252? utf-8?):
+                    # inconclusivo, decide pela decodificação estrita do arquivo inteiro
+                    codificacao_origem = None
+            if codificacao_origem:
+                try:
+                    codecs.lookup(codificacao_origem)
+                    log.append(f"-> Arquivo '{nome_arquivo}': detectado como '{codificacao_origem}'.")
+                except LookupError:
+                    # Se a detecção falhar na prática, tenta o fallback
+                    codificacao_origem = None
+
+            if not codificacao_origem:
+                if cabecalho_ascii:
+                    log.append(f"-> Arquivo '{nome_arquivo}': início em ASCII, testando codificações comuns no arquivo todo...")
+                else:
+                    log.append(f"-> ⚠️ Aviso: Detecção automática de '{nome_arquivo}' falhou. Tentando codificações comuns...")
                 with open(caminho_completo_entrada, 'rb') as f_bin:
                     conteudo_bin = f_bin.read()
-                    
-                    # Tenta a detecção automática com chardet
-                    resultado_detec = chardet.detect(conteudo_bin)
-                    codificacao_origem = resultado_detec['encoding']
-
-                    # Lista de fallback para tentar caso chardet falhe
-                    codificacoes_fallback = ['utf-8', 'cp1252', 'latin1', 'utf-16']
-
-                    # Lógica de tentativa e erro
-                    if codificacao_origem and codificacao_origem.lower() != 'ascii':
-                        self.log_area.append(f"-> Arquivo '{nome_arquivo}': detectado como '{codificacao_origem}'.")
-                        try:
-                            conteudo_texto = conteudo_bin.decode(codificacao_origem, errors='replace')
-                        except (UnicodeDecodeError, LookupError):
-                            # Se a detecção do chardet falhar na prática, tenta o fallback
-                            codificacao_origem = None
-
-                    if not codificacao_origem:
-                        self.log_area.append(f"-> ⚠️ Aviso: Detecção automática de '{nome_arquivo}' falhou. Tentando codificações comuns...")
-                        
-                        for fallback_encoding in codificacoes_fallback:
-                            try:
-                                conteudo_texto = conteudo_bin.decode(fallback_encoding, errors='replace')
-                                codificacao_origem = fallback_encoding
-                                self.log_area.append(f"   -> Encontrada: '{fallback_encoding}'.")
-                                break
-                            except (UnicodeDecodeError, LookupError):
-                                continue
-
-                    if conteudo_texto is None:
-                        self.log_area.append(f"-> ❌ Erro: Não foi possível decodificar '{nome_arquivo}' com as codificações tentadas. Pulando.")
+                # Decodificação estrita: um erro real passa para a próxima candidata;
+                # latin1, a última, aceita qualquer byte e encerra a busca
+                for fallback_encoding in CODIFICACOES_FALLBACK:
+                    try:
+                        conteudo_bin.decode(fallback_encoding)
+                    except UnicodeDecodeError:
                         continue
-                        
-                # Recodificar e salvar, ignorando caracteres inválidos
-                with open(caminho_completo_saida, 'w', encoding=codificacao_destino, errors='ignore') as f_saida:
-                    f_saida.write(conteudo_texto)
-                
-                self.log_area.append(f"   -> ✅ Conversão para '{codificacao_destino}' concluída com sucesso.\n")
-
-            except Exception as e:
-                self.log_area.append(f"-> ❌ Erro inesperado ao processar '{nome_arquivo}': {e}\n")
+                    codificacao_origem = fallback_encoding
+                    log.append(f"   -> Encontrada: '{fallback_encoding}'.")
+                    break
+
+            # Recodificar em blocos de 64 KiB, sem carregar o arquivo inteiro; grava num
+            # temporário e troca no fim, pois a saída pode ser o próprio arquivo de entrada
+            caminho_temp = caminho_completo_saida + '.tmp'
+            with open(caminho_completo_entrada, 'rb', buffering=BLOCO_IO) as f_bin, \
+                    open(caminho_temp, 'w', encoding=codificacao_destino, errors='ignore',
+                         buffering=BLOCO_IO, newline='') as f_saida:
+                blocos = iter(lambda: f_bin.read(BLOCO_IO), b'')
+                for texto in codecs.iterdecode(blocos, codificacao_origem, errors='replace'):
+                    f_saida.write(texto)
+            os.replace(caminho_temp, caminho_completo_saida)
+
+            log.append(f"   -> ✅ Conversão para '{codificacao_destino}' concluída com sucesso.\n")
+
+        except Exception as e:
+            log.append(f"-> ❌ Erro inesperado ao processar '{nome_arquivo}': {e}\n")
+        return log
 
 if __name__ == '__main__':
     app = QApplication([])
@@ -12,13 +12,26 @@ from pathlib import Path
 import subprocess
 import json
 import os
-import chardet
+import mmap
+import tempfile
+# Detector de codificação: cchardet (C, bem mais rápido) quando disponível,
+# senão charset_normalizer; chardet fica como último recurso. Todos expõem
+# detect(bytes) -> {'encoding': ...}.
+try:
+    import cchardet as _cd
+except ImportError:
+    try:
+        import charset_normalizer as _cd
+    except ImportError:
+        import chardet as _cd
 import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QTabWidget, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QLineEdit, QPushButton, QListWidget, QComboBox, QCheckBox, QMessageBox, QFileDialog, QTextEdit
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QThread, QObject, QEvent
+from PyQt6.QtCore import Qt, pyqtSignal, QThread, QObject, QTimer
 
 FFMPEG_PATH = r"C:\Program Files\FFMPEG\bin\ffmpeg.exe"
 FFPROBE_PATH = r"C:\Program Files\FFMPEG\bin\ffprobe.exe"
@@ -27,10 +40,149 @@ MKVINFO_PATH = r"C:\Program Files\MKVToolNix\mkvinfo.exe"
 MKVMERGE_PATH = r"C:\Program Files\MKVToolNix\mkvmerge.exe"
 SRTDEF_PATH = Path(r"C:\subtitles")
 TEMP_FOLDER = Path(r"E:\DB\TempSubs")
+ENC_CACHE_FILE = TEMP_FOLDER / ".enc_cache.json"
+DETECT_WINDOW = 4096  # bytes iniciais usados na detecção de codificação
+MAX_WORKERS = min(8, os.cpu_count() or 1)  # conversões simultâneas no tab2
+# Muxer do ffmpeg para cada formato de saída (não há muxer "ssa" nem "mks")
+FFMPEG_MUXERS = {"srt": "srt", "ass": "ass", "ssa": "ass", "mks": "matroska"}
+FFMPEG_BATCH = 32  # legendas por processo ffmpeg na conversão em lote (limite da linha de comando)
+# Tentativas estritas no arquivo todo quando a detecção é inconclusiva, em ordem
+FALLBACK_ENCODINGS = ('utf-8', 'cp1252')
+
+def _sniff_encoding(raw):
+    """Identifica BOM ou ASCII puro sem rodar o detector; None se inconclusivo."""
+    if raw.startswith(b'\xef\xbb\xbf'):
+        return 'utf-8-sig'
+    if raw[:2] in (b'\xff\xfe', b'\xfe\xff'):
+        return 'utf-16'
+    if raw.isascii():
+        return 'ascii'
+    return None
+
+def _strict_encoding(raw):
+    """Primeira de FALLBACK_ENCODINGS que decodifica raw inteiro sem erros; None se nenhuma."""
+    for encoding in FALLBACK_ENCODINGS:
+        try:
+            raw.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+        return encoding
+    return None
+
+
+# Probers usados quando o detector é o chardet puro (cchardet e charset_normalizer
+# ignoram). Por padrão só alfabeto latino; acrescente 'cyrillic', 'greek',
+# 'single-byte' (todos os de 1 byte) ou 'cjk' para legendas em outras línguas.
+ENABLED_PROBERS = ['utf-8', 'latin-1']
+
+# Um UniversalDetector por thread, reiniciado a cada arquivo em vez de recriado
+# (charset_normalizer não tem detector incremental e segue com detect())
+_UniversalDetector = getattr(_cd, 'UniversalDetector', None)
+if _cd.__name__ == 'chardet':
+    # A troca de probers usa internos do chardet (módulos dos probers e a lista
+    # _charset_probers); se não existirem nesta versão, fica o detector padrão
+    try:
+        from chardet.charsetgroupprober import CharSetGroupProber
+        from chardet.latin1prober import Latin1Prober
+        from chardet.mbcsgroupprober import MBCSGroupProber
+        from chardet.sbcharsetprober import SingleByteCharSetProber
+        from chardet.sbcsgroupprober import SBCSGroupProber
+        from chardet.utf8prober import UTF8Prober
+        from chardet import langgreekmodel, langrussianmodel
+    except ImportError:
+        pass
+    else:
+        def _grupo_probers(*modelos):
+            grupo = CharSetGroupProber()
+            grupo.probers = [SingleByteCharSetProber(m) for m in modelos]
+            grupo.reset()
+            return grupo
+
+        _PROBERS = {
+            'utf-8': UTF8Prober,
+            'latin-1': Latin1Prober,  # cobre cp1252 / iso-8859-1 / iso-8859-15
+            'cyrillic': lambda: _grupo_probers(
+                langrussianmodel.WINDOWS_1251_RUSSIAN_MODEL, langrussianmodel.KOI8_R_RUSSIAN_MODEL,
+                langrussianmodel.ISO_8859_5_RUSSIAN_MODEL, langrussianmodel.IBM866_RUSSIAN_MODEL),
+            'greek': lambda: _grupo_probers(
+                langgreekmodel.WINDOWS_1253_GREEK_MODEL, langgreekmodel.ISO_8859_7_GREEK_MODEL),
+            'single-byte': SBCSGroupProber,
+            'cjk': MBCSGroupProber,
+        }
+
+        class _DetectorLatino(_cd.UniversalDetector):
+            def __init__(self):
+                super().__init__()
+                # Com a lista já preenchida o feed() do chardet não monta a padrão (com todas as línguas)
+                self._charset_probers = [_PROBERS[nome]() for nome in ENABLED_PROBERS]
+
+        def _probers_sobrevivem_reset():
+            """True se esta versão do chardet guarda _charset_probers e o reset() a preserva."""
+            try:
+                det = _DetectorLatino()
+                det.reset()
+                return len(getattr(det, '_charset_probers', ())) == len(ENABLED_PROBERS)
+            except Exception:
+                return False
+
+        if _probers_sobrevivem_reset():
+            _UniversalDetector = _DetectorLatino
+_detector_local = threading.local()
+
+def _detect(raw):
+    """Detecta a codificação de raw alimentando o detector em blocos de 1 KiB."""
+    if _UniversalDetector is None:
+        return _cd.detect(raw)['encoding']
+    det = getattr(_detector_local, 'det', None)
+    if det is None:
+        det = _detector_local.det = _UniversalDetector()
+    det.reset()
+    for i in range(0, len(raw), 1024):
+        det.feed(raw[i:i + 1024])
+        if det.done:
+            break
+    det.close()
+    return det.result['encoding']
+
 
 class LogSignal(QObject):
     log_message = pyqtSignal(str)
 
+    def __init__(self, interval_ms=50):
+        super().__init__()
+        # Threads só enfileiram; o timer (thread da UI) emite um bloco por vez
+        self.pending = deque()
+        self.timer = QTimer(self)
+        self.timer.setInterval(interval_ms)
+        self.timer.timeout.connect(self.flush)
+        self.timer.start()
+
+    def push(self, message):
+        self.pending.append(message)
+
+    def flush(self):
+        batch = []
+        while self.pending:
+            batch.append(self.pending.popleft())
+        if batch:
+            self.log_message.emit("\n".join(batch))
+
+class Worker(QThread):
+    """Roda target(progress, *args) fora da UI; só conversa com widgets por sinais."""
+    progress = pyqtSignal(int, str)
+    done = pyqtSignal()
+
+    def __init__(self, target, *args):
+        super().__init__()
+        self.target = target
+        self.args = args
+
+    def run(self):
+        try:
+            self.target(self.progress.emit, *self.args)
+        finally:
+            self.done.emit()
+
 class SubtitleApp(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -66,6 +218,14 @@ class SubtitleApp(QMainWindow):
         self.log_signal = LogSignal()
         self.log_signal.log_message.connect(self.log_to_ui)
 
+        self._mkv_json_cache = {}  # (caminho, mtime_ns, tamanho) -> saída de mkvmerge -J
+        # Limita quantos ffmpeg rodam juntos para não saturar o disco
+        self._ffmpeg_slots = threading.BoundedSemaphore(max(1, MAX_WORKERS // 2))
+
+        # Cache de detecção de codificação: (caminho, tamanho, mtime_ns) -> codificação
+        self._enc_cache = self.load_enc_cache()
+        self._worker = None  # referência viva enquanto a thread roda
+
     def setup_tab1(self):
         layout = QVBoxLayout()
         
@@ -115,10 +275,10 @@ class SubtitleApp(QMainWindow):
         buttons_layout = QHBoxLayout()
         load_btn = QPushButton("Carregar Vídeos")
         load_btn.clicked.connect(self.load_videos)
-        execute_btn = QPushButton("Executar")
-        execute_btn.clicked.connect(self.start_execute_tab1)
+        self.execute_btn1 = QPushButton("Executar")
+        self.execute_btn1.clicked.connect(self.start_execute_tab1)
         buttons_layout.addWidget(load_btn)
-        buttons_layout.addWidget(execute_btn)
+        buttons_layout.addWidget(self.execute_btn1)
         layout.addLayout(buttons_layout)
         
         self.log_text1 = QTextEdit()
@@ -176,10 +336,10 @@ class SubtitleApp(QMainWindow):
         buttons_layout = QHBoxLayout()
         load_btn = QPushButton("Carregar Legendas")
         load_btn.clicked.connect(self.load_subs)
-        execute_btn = QPushButton("Executar")
-        execute_btn.clicked.connect(self.start_execute_tab2)
+        self.execute_btn2 = QPushButton("Executar")
+        self.execute_btn2.clicked.connect(self.start_execute_tab2)
         buttons_layout.addWidget(load_btn)
-        buttons_layout.addWidget(execute_btn)
+        buttons_layout.addWidget(self.execute_btn2)
         layout.addLayout(buttons_layout)
         
         self.log_text2 = QTextEdit()
@@ -219,136 +379,277 @@ class SubtitleApp(QMainWindow):
             self.video_list.addItem(info)
 
     def get_duration(self, file):
+        # Vem do mesmo JSON do mkvmerge (em nanossegundos): sem ffprobe extra
         try:
-            result = subprocess.run([FFPROBE_PATH, "-v", "error", "-show_entries", "format=duration", "-of", "default=noprint_wrappers=1:nokey=1", str(file)], capture_output=True, text=True)
-            return f"{float(result.stdout):.2f} s"
+            duration_ns = self.get_mkv_info(file)['container']['properties']['duration']
+            return f"{duration_ns / 1e9:.2f} s"
         except:
             return "Desconhecido"
 
+    def get_mkv_info(self, file):
+        # mkvmerge -J uma vez por arquivo; duração, contagem e faixas saem do mesmo JSON
+        st = os.stat(file)
+        key = (str(file), st.st_mtime_ns, st.st_size)
+        if key not in self._mkv_json_cache:
+            result = subprocess.run([MKVMERGE_PATH, "-J", str(file)], capture_output=True, text=True)
+            self._mkv_json_cache[key] = json.loads(result.stdout)
+        return self._mkv_json_cache[key]
+
     def get_subs_count(self, file):
         try:
-            result = subprocess.run([MKVMERGE_PATH, "-J", str(file)], capture_output=True, text=True)
-            info = json.loads(result.stdout)
+            info = self.get_mkv_info(file)
             return len([t for t in info['tracks'] if t['type'] == 'subtitles'])
         except:
             return 0
 
-    def get_first_sub_info(self, file):
+    def get_all_sub_info(self, file):
         try:
-            result = subprocess.run([MKVMERGE_PATH, "-J", str(file)], capture_output=True, text=True)
-            info = json.loads(result.stdout)
+            info = self.get_mkv_info(file)
+            subs = []
             for t in info['tracks']:
                 if t['type'] == 'subtitles':
                     codec = t['codec'].lower()
                     ext = 'srt' if 'subrip' in codec else 'ass' if 'ass' in codec else 'ssa' if 'ssa' in codec else 'mks'
-                    return t['id'], ext
-            return None, None
+                    lang = t.get('properties', {}).get('language', 'und')
+                    subs.append((t['id'], ext, lang))
+            return subs
         except:
-            return None, None
+            return []
+
+    def start_worker(self, target, *args):
+        # Widgets só são lidos aqui, na thread da UI; a thread recebe valores prontos
+        if self._worker is not None and self._worker.isRunning():
+            return  # substituir a referência deixaria a QThread em execução ser coletada
+        # um processo por vez: os dois "Executar" ficam bloqueados até o done
+        self.execute_btn1.setEnabled(False)
+        self.execute_btn2.setEnabled(False)
+        self._worker = Worker(target, *args)
+        self._worker.progress.connect(self.show_progress)
+        self._worker.done.connect(self.on_worker_done)
+        self._worker.start()
+
+    def show_progress(self, count, text):
+        self.statusBar().showMessage(f"{count} {text}")
+
+    def on_worker_done(self):
+        self.execute_btn1.setEnabled(True)
+        self.execute_btn2.setEnabled(True)
+        self.statusBar().clearMessage()
+        QMessageBox.information(self, "Concluído", "Processo finalizado.")
 
     def start_execute_tab1(self):
         self.log_text1.clear()
-        thread = threading.Thread(target=self.execute_tab1)
-        thread.start()
+        file_names = [self.video_list.item(i).text().split(" | ")[0] for i in range(self.video_list.count())]
+        self.start_worker(self.execute_tab1, file_names,
+                          Path(self.input_folder1.text()), Path(self.output_folder1.text()),
+                          self.format_combo1.currentText(), self.encoding_combo1.currentText(),
+                          self.overwrite1.isChecked(), self.verbose1.isChecked())
 
-    def execute_tab1(self):
-        input_path = Path(self.input_folder1.text())
-        output_path = Path(self.output_folder1.text())
-        out_format = self.format_combo1.currentText()
-        out_encoding_text = self.encoding_combo1.currentText()
+    def execute_tab1(self, progress, file_names, input_path, output_path, out_format,
+                     out_encoding_text, overwrite, verbose):
         out_encoding = self.get_encoding_code(out_encoding_text)
-        overwrite = self.overwrite1.isChecked()
-        verbose = self.verbose1.isChecked()
         
         os.makedirs(TEMP_FOLDER, exist_ok=True)
         
-        for i in range(self.video_list.count()):
-            item = self.video_list.item(i)
-            file_name = item.text().split(" | ")[0]
+        for i, file_name in enumerate(file_names):
+            progress(i + 1, file_name)
             mkv_file = input_path / file_name
-            sub_file = output_path / f"{mkv_file.stem}.{out_format}"
-            
-            if not overwrite and sub_file.exists():
-                sub_file = output_path / f"{mkv_file.stem}_new.{out_format}"
             
             self.log(f"Processando {file_name}...", verbose)
             
-            track_id, orig_ext = self.get_first_sub_info(mkv_file)
-            if track_id is None:
+            subs = self.get_all_sub_info(mkv_file)
+            if not subs:
                 self.log(f"Nenhuma legenda encontrada em {file_name}", verbose)
                 continue
             
-            temp_sub = TEMP_FOLDER / f"{mkv_file.stem}.{orig_ext}"
-            cmd = [MKVEXTRACT_PATH, "tracks", str(mkv_file), f"{track_id}:{temp_sub}"]
-            self.run_cmd(cmd, verbose, "Extração")
+            # Arquivo de saída de cada faixa (a primeira fica com o nome do vídeo)
+            targets = []
+            for k, (track_id, orig_ext, lang) in enumerate(subs):
+                stem = mkv_file.stem if k == 0 else f"{mkv_file.stem}.{track_id}.{lang}"
+                sub_file = output_path / f"{stem}.{out_format}"
+                if not overwrite and sub_file.exists():
+                    sub_file = output_path / f"{stem}_new.{out_format}"
+                targets.append((track_id, orig_ext, sub_file))
             
-            self.convert_sub(temp_sub, sub_file, out_format, out_encoding, out_encoding_text, verbose)
+            if len(targets) == 1:
+                # Faixa única: o ffmpeg entrega a legenda já no formato final pelo stdout,
+                # sem passar por TEMP_FOLDER
+                track_id, _, sub_file = targets[0]
+                cmd = [FFMPEG_PATH, "-nostdin", "-hide_banner", "-loglevel", "error", "-i", str(mkv_file),
+                       "-map", f"0:{track_id}"]
+                if out_format == "mks":
+                    cmd += ["-c:s", "copy"]
+                cmd += ["-f", FFMPEG_MUXERS[out_format], "pipe:1"]
+                with self._ffmpeg_slots:
+                    raw = self.run_cmd(cmd, verbose, "Extração", capture=True)
+                if raw:  # falha já foi registrada por run_cmd
+                    self.save_converted(raw, sub_file, out_format, out_encoding, out_encoding_text, verbose)
+                continue
             
-            os.remove(temp_sub)
+            # Várias faixas: um mkvextract lê o MKV uma vez e grava todas em temporários
+            targets = [(tid, self.make_temp(f".{ext}"), sub_file) for tid, ext, sub_file in targets]
+            # finally: os temporários somem mesmo se a extração ou a conversão falhar
+            try:
+                cmd = [MKVEXTRACT_PATH, "tracks", str(mkv_file)] + [f"{tid}:{temp}" for tid, temp, _ in targets]
+                self.run_cmd(cmd, verbose, "Extração")
+                
+                for _, temp_sub, sub_file in targets:
+                    self.convert_sub(temp_sub, sub_file, out_format, out_encoding, out_encoding_text, verbose)
+            finally:
+                for _, temp_sub, _ in targets:
+                    temp_sub.unlink(missing_ok=True)
         
         self.log("Extração e conversão concluídas.", verbose)
-        QApplication.postEvent(self, QEvent(QEvent.Type.User))  # Para mostrar mensagem final
 
     def start_execute_tab2(self):
         self.log_text2.clear()
-        thread = threading.Thread(target=self.execute_tab2)
-        thread.start()
+        file_names = [self.sub_list.item(i).text().split(" | ")[0] for i in range(self.sub_list.count())]
+        self.start_worker(self.execute_tab2, file_names,
+                          Path(self.input_folder2.text()), Path(self.output_folder2.text()),
+                          self.format_combo2.currentText(), self.encoding_combo2.currentText(),
+                          self.overwrite2.isChecked(), self.verbose2.isChecked())
 
-    def execute_tab2(self):
-        input_path = Path(self.input_folder2.text())
-        output_path = Path(self.output_folder2.text())
-        out_format = self.format_combo2.currentText()
-        out_encoding_text = self.encoding_combo2.currentText()
+    def execute_tab2(self, progress, file_names, input_path, output_path, out_format,
+                     out_encoding_text, overwrite, verbose):
         out_encoding = self.get_encoding_code(out_encoding_text)
-        overwrite = self.overwrite2.isChecked()
-        verbose = self.verbose2.isChecked()
         
         os.makedirs(TEMP_FOLDER, exist_ok=True)
         
-        for i in range(self.sub_list.count()):
-            item = self.sub_list.item(i)
-            file_name = item.text().split(" | ")[0]
+        jobs = []
+        for file_name in file_names:
             sub_file_in = input_path / file_name
             sub_file_out = output_path / f"{sub_file_in.stem}.{out_format}"
             
             if not overwrite and sub_file_out.exists():
                 sub_file_out = output_path / f"{sub_file_in.stem}_new.{out_format}"
-            
+            jobs.append((file_name, sub_file_in, sub_file_out))
+        
+        # Troca de formato vai em lote (um ffmpeg para várias legendas); o resto só recodifica
+        format_jobs = [job for job in jobs if job[1].suffix.lower().lstrip('.') != out_format]
+        recode_jobs = [job for job in jobs if job[1].suffix.lower().lstrip('.') == out_format]
+        
+        # Cada legenda é independente: converte em paralelo
+        def convert_one(file_name, sub_file_in, sub_file_out):
             self.log(f"Processando {file_name}...", verbose)
-            
             self.convert_sub(sub_file_in, sub_file_out, out_format, out_encoding, out_encoding_text, verbose)
         
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+            futures = [pool.submit(convert_one, *job) for job in recode_jobs]
+            futures.append(pool.submit(self.convert_subs_batch, format_jobs, out_format,
+                                       out_encoding, out_encoding_text, verbose))
+            for done, future in enumerate(as_completed(futures), 1):
+                try:
+                    future.result()
+                except Exception as e:
+                    self.log(f"Erro: {e}", verbose)
+                progress(done, f"de {len(futures)} tarefas concluídas")
+        
         self.log("Conversão concluída.", verbose)
-        QApplication.postEvent(self, QEvent(QEvent.User))
 
     def convert_sub(self, input_sub, output_sub, out_format, out_encoding, out_encoding_text, verbose=False):
-        temp_conv = TEMP_FOLDER / f"conv.{out_format}"
-        cmd = [FFMPEG_PATH, "-i", str(input_sub), str(temp_conv)]
-        self.run_cmd(cmd, verbose, "Conversão de formato")
-        
-        src_enc = self.detect_encoding(temp_conv) or 'utf-8'
-        self.log(f"Codificação detectada: {src_enc}", verbose)
-        try:
-            with open(temp_conv, 'r', encoding=src_enc) as f:
-                content = f.read()
-        except UnicodeDecodeError:
-            self.log("Erro de decodificação, usando utf-8 com replace", verbose)
-            with open(temp_conv, 'r', encoding='utf-8', errors='replace') as f:
-                content = f.read()
-        
+        input_sub = Path(input_sub)
+        same_format = input_sub.suffix.lower().lstrip('.') == out_format
+        if same_format:
+            # Só muda a codificação (ex.: srt -> srt): resolve em processo, sem ffmpeg
+            src_enc = self.detect_encoding(input_sub) or 'utf-8'
+            self.log(f"Codificação detectada: {src_enc}", verbose)
+            raw = input_sub.read_bytes()
+            # Normaliza quebras de linha (CRLF/CR -> LF); a escrita em modo texto aplica a do sistema
+            wide = src_enc.lower().replace('_', '-').startswith(('utf-16', 'utf-32'))
+            if not wide:
+                # Codificação compatível com ASCII: BOM e quebras corrigidos direto nos bytes
+                raw = raw.removeprefix(b'\xef\xbb\xbf').replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+            try:
+                content = raw.decode(src_enc)
+            except UnicodeDecodeError:
+                fallback = _strict_encoding(raw)
+                if fallback:
+                    self.log(f"Erro de decodificação com {src_enc}, usando {fallback}", verbose)
+                    content = raw.decode(fallback)
+                else:
+                    self.log("Erro de decodificação, usando utf-8 com replace", verbose)
+                    content = raw.decode('utf-8', errors='replace')
+            if wide:
+                # Em UTF-16/32 o CR ocupa 2-4 bytes: só dá para corrigir no texto
+                content = content.replace('\r\n', '\n').replace('\r', '\n')
+        else:
+            # ffmpeg escreve a legenda convertida no stdout; nada passa pelo disco
+            cmd = [FFMPEG_PATH, "-nostdin", "-hide_banner", "-loglevel", "error",
+                   "-i", str(input_sub), "-f", FFMPEG_MUXERS[out_format], "pipe:1"]
+            with self._ffmpeg_slots:
+                raw = self.run_cmd(cmd, verbose, "Conversão de formato", capture=True)
+            if raw:  # falha já foi registrada por run_cmd
+                self.save_converted(raw, output_sub, out_format, out_encoding, out_encoding_text, verbose)
+            return
+
+        self.write_sub(content, output_sub, out_encoding, out_encoding_text)
+        self.log(f"Salvo em {output_sub}", verbose)
+
+    def save_converted(self, raw, output_sub, out_format, out_encoding, out_encoding_text, verbose=False):
+        """Grava a saída do ffmpeg (bytes) na codificação pedida."""
+        if out_format == "mks":
+            # Contêiner binário: grava como veio, não há texto para recodificar
+            with open(output_sub, 'wb') as f:
+                f.write(raw)
+        else:
+            # Os muxers de texto do ffmpeg sempre emitem UTF-8
+            self.write_sub(raw.decode('utf-8', errors='replace'), output_sub, out_encoding, out_encoding_text)
+        self.log(f"Salvo em {output_sub}", verbose)
+
+    def convert_subs_batch(self, jobs, out_format, out_encoding, out_encoding_text, verbose=False):
+        """Troca o formato de várias legendas com um só ffmpeg: N entradas, uma saída por entrada."""
+        muxer = FFMPEG_MUXERS[out_format]
+        for start in range(0, len(jobs), FFMPEG_BATCH):
+            chunk = jobs[start:start + FFMPEG_BATCH]
+            temps = [self.make_temp(f".{out_format}") for _ in chunk]
+            try:
+                cmd = [FFMPEG_PATH, "-nostdin", "-hide_banner", "-loglevel", "error", "-y"]
+                for _, sub_file_in, _ in chunk:
+                    cmd += ["-i", str(sub_file_in)]
+                for n, temp in enumerate(temps):
+                    # Só a primeira faixa de cada entrada, como em convert_sub: um .mks com várias
+                    # faixas não cabe num muxer srt/ass
+                    cmd += ["-map", f"{n}:s:0", "-f", muxer, str(temp)]
+                with self._ffmpeg_slots:
+                    self.run_cmd(cmd, verbose, "Conversão de formato em lote")
+                
+                for (file_name, sub_file_in, sub_file_out), temp in zip(chunk, temps):
+                    self.log(f"Processando {file_name}...", verbose)
+                    raw = temp.read_bytes()
+                    if not raw:
+                        # Temporário vazio: uma entrada inválida derrubou o lote, refaz esta sozinha
+                        self.convert_sub(sub_file_in, sub_file_out, out_format, out_encoding, out_encoding_text, verbose)
+                        continue
+                    self.save_converted(raw, sub_file_out, out_format, out_encoding, out_encoding_text, verbose)
+            finally:
+                for temp in temps:
+                    temp.unlink(missing_ok=True)
+
+    def make_temp(self, suffix):
+        # Nome único em TEMP_FOLDER; o arquivo é fechado logo (no Windows outro processo
+        # não escreve num arquivo aberto) e quem chama apaga no finally
+        with tempfile.NamedTemporaryFile(suffix=suffix, dir=TEMP_FOLDER, delete=False) as tmp:
+            return Path(tmp.name)
+
+    def write_sub(self, content, output_sub, out_encoding, out_encoding_text):
         if "BOM" in out_encoding_text and "UTF-8" in out_encoding_text:
             with open(output_sub, 'w', encoding='utf-8-sig') as f:
                 f.write(content)
         else:
             with open(output_sub, 'w', encoding=out_encoding) as f:
                 f.write(content)
-        
-        os.remove(temp_conv)
-        self.log(f"Salvo em {output_sub}", verbose)
 
-    def run_cmd(self, cmd, verbose, desc):
+    def run_cmd(self, cmd, verbose, desc, capture=False):
+        """Roda cmd; com capture=True devolve o stdout em bytes, ou None se o comando falhar."""
         if verbose:
             print(f"Executando {desc}: {' '.join(cmd)}")
+        if capture:
+            result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            if result.returncode != 0:
+                err = result.stderr.decode(errors='replace') if result.stderr else "Erro desconhecido"
+                self.log(f"Erro em {desc}: {err}", verbose)
+                return None
+            return result.stdout
         result = subprocess.run(cmd, capture_output=not verbose, text=True)
         if result.returncode != 0:
             err = result.stderr if result.stderr else "Erro desconhecido"
@@ -359,18 +660,19 @@ class SubtitleApp(QMainWindow):
     def log(self, message, verbose):
         if verbose:
             print(message)
-            self.log_signal.log_message.emit(message)
+            self.log_signal.push(message)
 
     def log_to_ui(self, message):
         current_tab = self.tab_widget.currentWidget()
         if current_tab == self.tab1:
-            self.log_text1.append(message)
+            log_text = self.log_text1
         elif current_tab == self.tab2:
-            self.log_text2.append(message)
-
-    def customEvent(self, event):
-        if event.type() == QEvent.User:
-            QMessageBox.information(self, "Concluído", "Processo finalizado.")
+            log_text = self.log_text2
+        else:
+            return
+        log_text.setUpdatesEnabled(False)
+        log_text.append(message)
+        log_text.setUpdatesEnabled(True)
 
     def load_subs(self):
         input_path = Path(self.input_folder2.text())
@@ -382,12 +684,59 @@ class SubtitleApp(QMainWindow):
                 info = f"{file.name} | Extensão: {file.suffix} | Codificação: {encoding}"
                 self.sub_list.addItem(info)
 
+    def load_enc_cache(self):
+        try:
+            with open(ENC_CACHE_FILE, 'r', encoding='utf-8') as f:
+                return {(p, size, mtime): enc for p, size, mtime, enc in json.load(f)}
+        except (OSError, ValueError, TypeError):
+            return {}
+
+    def save_enc_cache(self):
+        # Só persiste entradas de arquivos que ainda existem
+        entries = [[p, size, mtime, enc] for (p, size, mtime), enc in self._enc_cache.items()
+                   if os.path.exists(p)]
+        try:
+            os.makedirs(TEMP_FOLDER, exist_ok=True)
+            with open(ENC_CACHE_FILE, 'w', encoding='utf-8') as f:
+                json.dump(entries, f)
+        except OSError:
+            pass
+
+    def closeEvent(self, event):
+        self.save_enc_cache()
+        super().closeEvent(event)
+
     def detect_encoding(self, file):
+        try:
+            st = os.stat(file)
+        except OSError:
+            return None
+        key = (str(file), st.st_size, st.st_mtime_ns)
+        if key in self._enc_cache:
+            return self._enc_cache[key]
+        encoding = self._detect_encoding_uncached(file)
+        if encoding:
+            self._enc_cache[key] = encoding
+        return encoding
+
+    def _detect_encoding_uncached(self, file):
         try:
             with open(file, 'rb') as f:
-                raw = f.read(10000)
-                result = chardet.detect(raw)
-                return result['encoding']
+                size = os.fstat(f.fileno()).st_size
+                if size <= DETECT_WINDOW:
+                    # Arquivo pequeno: um read simples custa menos que mapear
+                    raw = f.read()
+                else:
+                    # Fatia do cabeçalho direto do page cache, sem buffer intermediário
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        raw = mm[:DETECT_WINDOW]
+                encoding = _sniff_encoding(raw) or _detect(raw)
+                if encoding and encoding.lower() == 'ascii' and size > DETECT_WINDOW:
+                    # Só a janela é ASCII: acentos podem vir depois dela, então a
+                    # janela é inconclusiva e a decisão fica com o arquivo todo
+                    f.seek(0)
+                    encoding = _strict_encoding(f.read())
+                return encoding
         except:
             return None
 
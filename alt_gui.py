@@ -0,0 +1,337 @@
+# Interface do alt.py (extração de legendas de MKV); separada para que importar
+# alt não carregue o PyQt6
+import os
+import sys
+import json
+import asyncio
+import subprocess
+import itertools
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from PyQt6.QtWidgets import (
+    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+    QFileDialog, QCheckBox, QTableWidget, QTableWidgetItem, QMessageBox, QLineEdit, QComboBox, QTextEdit
+)
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from alt import (
+    FFMPEG_PATH, MKVEXTRACT_PATH, TEMP_FOLDER, PROBE_WORKERS, PROBE_CACHE_FILE, EXTRACT_WORKERS,
+    POPEN_KW, probe,
+)
+
+class ExtractionWorker(QThread):
+    message = pyqtSignal(str)
+
+    def __init__(self, extractor, jobs, output_folder, overwrite, existing):
+        super().__init__()
+        self.extractor = extractor
+        self.jobs = jobs
+        self.output_folder = output_folder
+        self.overwrite = overwrite
+        self.existing = existing
+
+    def run(self):
+        # Loop asyncio próprio desta thread: o loop do Qt segue intocado
+        asyncio.run(self.run_all())
+
+    async def run_all(self):
+        # Cada arquivo é um subprocesso independente aguardado no loop; o semáforo
+        # limita quantos rodam juntos
+        slots = asyncio.Semaphore(EXTRACT_WORKERS)
+
+        async def one(file, full_path, track_id, codec):
+            async with slots:
+                return await self.extractor.extract_one(file, full_path, track_id, codec,
+                                                        self.output_folder, self.overwrite, self.existing)
+
+        for done in asyncio.as_completed([one(*job) for job in self.jobs]):
+            self.message.emit(await done)
+
+class SubtitleExtractor(QWidget):
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("🎬 Extrator de Legendas MKV")
+        self.resize(900, 600)
+        self.files = []
+        self.track_map = {}
+        self.combo_boxes = {}
+        self._track_index = {}  # arquivo -> {id da faixa: posição no combo}
+        # caminho real -> (mtime_ns, tamanho, faixas); lido do disco no primeiro load_files
+        self._probe_cache = None
+        self._probe_cache_dirty = False
+        self.worker = None
+
+        self.init_ui()
+
+    def init_ui(self):
+        layout = QVBoxLayout()
+
+        input_layout = QHBoxLayout()
+        self.input_path = QLineEdit()
+        input_button = QPushButton("Selecionar pasta de vídeos")
+        input_button.clicked.connect(self.select_input_folder)
+        input_layout.addWidget(QLabel("📁"))
+        input_layout.addWidget(self.input_path)
+        input_layout.addWidget(input_button)
+        layout.addLayout(input_layout)
+
+        output_layout = QHBoxLayout()
+        self.output_path = QLineEdit()
+        output_button = QPushButton("Selecionar pasta de saída")
+        output_button.clicked.connect(self.select_output_folder)
+        output_layout.addWidget(QLabel("📂"))
+        output_layout.addWidget(self.output_path)
+        output_layout.addWidget(output_button)
+        layout.addLayout(output_layout)
+
+        self.save_in_source = QCheckBox("Salvar na pasta de origem")
+        self.overwrite_files = QCheckBox("Sobrescrever arquivos existentes")
+        layout.addWidget(self.save_in_source)
+        layout.addWidget(self.overwrite_files)
+
+        default_layout = QHBoxLayout()
+        self.default_track = QLineEdit()
+        apply_default_button = QPushButton("Aplicar faixa padrão")
+        apply_default_button.clicked.connect(self.apply_default_track)
+        default_layout.addWidget(QLabel("🎯 Faixa padrão:"))
+        default_layout.addWidget(self.default_track)
+        default_layout.addWidget(apply_default_button)
+        layout.addLayout(default_layout)
+
+        self.table = QTableWidget()
+        self.table.setColumnCount(3)
+        self.table.setHorizontalHeaderLabels(["Arquivo", "Faixas", "Selecionar faixa"])
+        layout.addWidget(self.table)
+
+        self.extract_button = QPushButton("🚀 Extrair Legendas")
+        self.extract_button.clicked.connect(self.run_extraction)
+        layout.addWidget(self.extract_button)
+
+        self.log_view = QTextEdit()
+        self.log_view.setReadOnly(True)
+        layout.addWidget(self.log_view)
+
+        self.setLayout(layout)
+
+    def select_input_folder(self):
+        folder = QFileDialog.getExistingDirectory(self, "Selecionar pasta de vídeos")
+        if folder:
+            self.input_path.setText(folder)
+            self.load_files(folder)
+
+    def select_output_folder(self):
+        folder = QFileDialog.getExistingDirectory(self, "Selecionar pasta de saída")
+        if folder:
+            self.output_path.setText(folder)
+
+    def load_files(self, folder):
+        self.files.clear()
+        self.track_map.clear()
+        self.combo_boxes.clear()
+        self._track_index.clear()
+        self.table.setRowCount(0)
+
+        with os.scandir(os.path.normpath(folder)) as it:
+            entries = [e for e in it if e.is_file() and e.name.lower().endswith(".mkv")]
+        names = [e.name for e in entries]
+        paths = [e.path for e in entries]
+
+        if self._probe_cache is None:
+            self._probe_cache = self.load_probe_cache()
+
+        # Os widgets são criados depois do probe, nesta thread
+        results = self.probe_many(paths)
+        if self._probe_cache_dirty:
+            self.save_probe_cache()
+
+        # Linhas pré-alocadas e pintura suspensa: um único layout no fim, não um por linha
+        sorting = self.table.isSortingEnabled()
+        self.table.setUpdatesEnabled(False)
+        self.table.setSortingEnabled(False)
+        self.table.setRowCount(len(entries))
+        for row, (file, full_path, tracks) in enumerate(zip(names, paths, results)):
+            self.files.append((file, full_path))
+            self.track_map[file] = tracks
+
+            self.table.setItem(row, 0, QTableWidgetItem(file))
+            self.table.setItem(row, 1, QTableWidgetItem(", ".join([f"{i}:{l}" for i, l, _ in tracks])))
+
+            combo = QComboBox()
+            for i, lang, _ in tracks:
+                combo.addItem(f"{i}:{lang}")
+            if combo.count() > 0:
+                combo.setCurrentIndex(0)
+            self.table.setCellWidget(row, 2, combo)
+            self.combo_boxes[file] = combo
+            self._track_index[file] = {i: pos for pos, (i, _, _) in enumerate(tracks)}
+        self.table.setSortingEnabled(sorting)
+        self.table.setUpdatesEnabled(True)
+
+    def load_probe_cache(self):
+        try:
+            with open(PROBE_CACHE_FILE, "r", encoding="utf-8") as f:
+                # Entradas de versões antigas, sem o codec, são descartadas e reprobadas
+                return {path: (mtime, size, [tuple(t) for t in tracks])
+                        for path, (mtime, size, tracks) in json.load(f).items()
+                        if all(len(t) == 3 for t in tracks)}
+        except (OSError, ValueError, TypeError):
+            return {}
+
+    def save_probe_cache(self):
+        try:
+            TEMP_FOLDER.mkdir(parents=True, exist_ok=True)
+            with open(PROBE_CACHE_FILE, "w", encoding="utf-8") as f:
+                json.dump(self._probe_cache, f)
+            self._probe_cache_dirty = False
+        except OSError as e:
+            print(f"[WARN] Não foi possível salvar o cache de ffprobe: {e}")
+
+    def probe_many(self, paths):
+        # ffprobe só aceita uma entrada por execução: o que dá para amortizar é a espera,
+        # sobrepondo os processos no pool. Acertos de cache nem chegam a abrir o pool.
+        results = {}
+        pending = []
+        for path in paths:
+            _, _, tracks = self.cached_subtitle_tracks(path)
+            if tracks is None:
+                pending.append(path)
+            else:
+                results[path] = tracks
+        if pending:
+            with ThreadPoolExecutor(max_workers=min(PROBE_WORKERS, len(pending))) as ex:
+                results.update(zip(pending, ex.map(self.get_subtitle_tracks, pending)))
+        return [results[path] for path in paths]
+
+    def cached_subtitle_tracks(self, file_path):
+        # Arquivo sem mudança (mesmo mtime e tamanho) não passa de novo pelo ffprobe
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None, None, []
+        key = os.path.realpath(file_path)
+        cached = self._probe_cache.get(key)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return key, st, cached[2]
+        return key, st, None
+
+    def get_subtitle_tracks(self, file_path):
+        key, st, tracks = self.cached_subtitle_tracks(file_path)
+        if tracks is not None:
+            return tracks
+        tracks = probe(file_path)
+        if tracks is not None:
+            self._probe_cache[key] = (st.st_mtime_ns, st.st_size, tracks)
+            self._probe_cache_dirty = True
+        return tracks or []
+
+    def apply_default_track(self):
+        default = self.default_track.text().strip()
+        if not default:
+            return
+        for file, combo in self.combo_boxes.items():
+            idx = self._track_index[file].get(default)
+            if idx is not None:
+                combo.setCurrentIndex(idx)
+
+    def get_unique_filename(self, base_path, overwrite, existing):
+        # existing: nomes (casefold) da pasta de saída lidos uma vez por run_extraction,
+        # então cada candidato é um teste em set, sem stat, e sem limite de 99
+        if overwrite or base_path.name.casefold() not in existing:
+            return base_path
+        for i in itertools.count(1):
+            new_path = base_path.with_stem(f"{base_path.stem}_{i:02d}")
+            if new_path.name.casefold() not in existing:
+                return new_path
+
+    def run_extraction(self):
+        input_folder = Path(self.input_path.text().strip()).resolve()
+        output_folder = Path(self.output_path.text().strip()).resolve()
+        if self.save_in_source.isChecked():
+            output_folder = input_folder
+
+        output_folder.mkdir(parents=True, exist_ok=True)
+
+        self.log_view.clear()
+        self.append_log("[START] Iniciando extração...")
+
+        # Os combos são lidos aqui; a thread de extração só recebe valores prontos
+        jobs = []
+        for file, full_path in self.files:
+            combo = self.combo_boxes[file]
+            selected = combo.currentText()
+            if not selected or ":" not in selected:
+                self.append_log(f"[SKIP] {file}: faixa não selecionada.")
+                continue
+            track_id = selected.split(":")[0].strip()
+            codec = next((c for i, _, c in self.track_map[file] if i == track_id), "")
+            jobs.append((file, full_path, track_id, codec))
+
+        # Um único scandir da saída; os nomes gerados por esta execução não colidem entre si
+        # (cada MKV da pasta de entrada tem um nome base diferente)
+        overwrite = self.overwrite_files.isChecked()
+        existing = set()
+        if not overwrite:
+            with os.scandir(output_folder) as it:
+                existing = {e.name.casefold() for e in it}
+
+        self.extract_button.setEnabled(False)
+        self.worker = ExtractionWorker(self, jobs, output_folder, overwrite, existing)
+        self.worker.message.connect(self.append_log)
+        self.worker.finished.connect(self.extraction_finished)
+        self.worker.start()
+
+    async def extract_one(self, file, full_path, track_id, codec, output_folder, overwrite, existing):
+        # Roda no loop da ExtractionWorker: não toca em widgets, devolve a linha de log
+        # output_folder já vem resolvido e criado por run_extraction
+        final_srt = self.get_unique_filename((output_folder / file).with_suffix(".srt"), overwrite, existing)
+
+        try:
+            print(f"[EXTRACT] {file} - faixa {track_id}")
+            if codec == "subrip":
+                # Já é SRT: o mkvextract grava direto no destino, sem ffmpeg nem temporários
+                cmd = [MKVEXTRACT_PATH, "tracks", str(full_path), f"{track_id}:{final_srt}"]
+            else:
+                # ASS/SSA/WebVTT: o ffmpeg lê a faixa do próprio MKV (o índice do ffprobe é o
+                # mesmo do -map) e grava o SRT final, sem passar por TEMP_FOLDER
+                cmd = [
+                    FFMPEG_PATH, "-nostdin", "-y", "-hide_banner", "-loglevel", "error",
+                    "-i", str(full_path),
+                    "-map", f"0:{track_id}",
+                    "-c:s", "srt",
+                    str(final_srt)
+                ]
+            proc = await asyncio.create_subprocess_exec(
+                *cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, **POPEN_KW)
+            _, err = await proc.communicate()
+            if proc.returncode != 0:
+                # Só o stderr foi capturado: a última linha costuma ser o motivo
+                reason = err.decode(errors="replace").strip().splitlines()
+                return f"[FAIL] {file}: {reason[-1] if reason else f'código de saída {proc.returncode}'}"
+            return f"[SUCCESS] {final_srt.name} criado."
+
+        except Exception as e:
+            return f"[FAIL] {file}: {e}"
+
+    def append_log(self, message):
+        print(message)
+        self.log_view.append(message)
+
+    def extraction_finished(self):
+        self.append_log("[DONE] Extração finalizada.")
+        self.extract_button.setEnabled(True)
+        QMessageBox.information(self, "Concluído", "Extração de legendas finalizada.")
+
+def main():
+    app = QApplication(sys.argv)
+    # Tema escuro num stylesheet global: aplicado uma vez para a aplicação inteira
+    app.setStyleSheet(
+        "QWidget { background: #2b2b2b; color: white; }"
+        " QLineEdit, QTableWidget, QTextEdit, QComboBox { background: #3c3f41; }"
+        " QPushButton { background: #555555; }"
+    )
+    extractor = SubtitleExtractor()
+    extractor.show()
+    app.exec()
+
+if __name__ == "__main__":
+    main()
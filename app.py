@@ -1,9 +1,11 @@
 import os
 import sys
+import functools
 import shutil
 import subprocess
 import json
-import re
+import time
+from collections import deque
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Tuple
 
@@ -13,32 +15,75 @@ from PyQt6 import QtCore, QtGui, QtWidgets
 # Helpers
 # -----------------------------
 
+def _popen_kwargs() -> Dict:
+    """Extra Popen kwargs: on Windows, spawn console tools without a console window."""
+    if sys.platform != "win32":
+        return {}
+    si = subprocess.STARTUPINFO()
+    si.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    si.wShowWindow = subprocess.SW_HIDE
+    return {"creationflags": subprocess.CREATE_NO_WINDOW, "startupinfo": si}
+
+
+POPEN_KW = _popen_kwargs()
+
+
+@functools.lru_cache(maxsize=None)
+def _find_tool(name: str) -> Optional[str]:
+    """Return the tool path, checking alongside the script before walking PATH."""
+    script_dir = os.path.dirname(sys.argv[0])
+    for c in (os.path.join(script_dir, f"{name}.exe"), os.path.join(script_dir, name)):
+        if os.path.exists(c):
+            return c
+    return shutil.which(name)
+
+
 def which_ffmpeg() -> Optional[str]:
     """Return ffmpeg path if available in PATH or alongside the script."""
-    candidates = [
-        shutil.which("ffmpeg"),
-        os.path.join(os.path.dirname(sys.argv[0]), "ffmpeg.exe"),
-        os.path.join(os.path.dirname(sys.argv[0]), "ffmpeg"),
-    ]
-    for c in candidates:
-        if c and os.path.exists(c):
-            return c
-    return None
+    return _find_tool("ffmpeg")
 
 
 def which_ffprobe() -> Optional[str]:
-    candidates = [
-        shutil.which("ffprobe"),
-        os.path.join(os.path.dirname(sys.argv[0]), "ffprobe.exe"),
-        os.path.join(os.path.dirname(sys.argv[0]), "ffprobe"),
-    ]
-    for c in candidates:
-        if c and os.path.exists(c):
-            return c
-    return None
+    return _find_tool("ffprobe")
+
 
+# Subtitle codecs ffmpeg can write to .srt without rasterizing; image-based
+# ones (hdmv_pgs_subtitle, dvd_subtitle, ...) can only be copied into a container
+TEXT_SUB_CODECS = frozenset({"subrip", "srt", "ass", "ssa", "mov_text", "webvtt", "text"})
+
+# Containers whose header already carries duration, codec ids and language tags
+# (Matroska Tracks/Info, MP4 moov). ffprobe only needs a short read to fill them in,
+# so their probe is capped well below the 5 MB default; TS/AVI keep the default
+# since their streams are only discovered from packets.
+HEADER_PROBE_EXTS = frozenset({".mkv", ".mka", ".webm", ".mp4", ".m4v", ".mov"})
+HEADER_PROBE_SIZE = "1000000"  # bytes / microseconds
+
+# Hardware encoders per acceleration backend: label -> {codec: encoder}
+HW_ENCODERS = {
+    "NVENC": {"h264": "h264_nvenc", "hevc": "hevc_nvenc"},
+    "QSV": {"h264": "h264_qsv", "hevc": "hevc_qsv"},
+    "AMF": {"h264": "h264_amf", "hevc": "hevc_amf"},
+}
 
-VIDEO_EXTS = {".mkv", ".mp4", ".avi", ".mov", ".ts", ".m2ts", ".wmv", ".flv"}
+
+@functools.lru_cache(maxsize=None)
+def available_hw_accels(ffmpeg_path: str) -> Tuple[str, ...]:
+    """Return the HW_ENCODERS backends this ffmpeg build was compiled with."""
+    try:
+        out = subprocess.check_output([ffmpeg_path, "-hide_banner", "-encoders"],
+                                      stderr=subprocess.DEVNULL, **POPEN_KW)
+    except Exception:
+        return ()
+    names = {line.split()[1] for line in out.decode("utf-8", "replace").splitlines()
+             if len(line.split()) > 1}
+    return tuple(hw for hw, enc in HW_ENCODERS.items() if enc["h264"] in names)
+
+
+# ffmpeg -progress keys carrying the output timestamp (both are in microseconds)
+_PROGRESS_TIME_KEYS = frozenset((b"out_time_us", b"out_time_ms"))
+
+VIDEO_EXTS = frozenset({".mkv", ".mp4", ".avi", ".mov", ".ts", ".m2ts", ".wmv", ".flv"})
+_VIDEO_SUFFIXES = tuple(VIDEO_EXTS)  # for str.endswith
 
 LANG_MAP = {
     "pt": ["por", "pt"],
@@ -67,6 +112,9 @@ class Job:
     target_codec_a: str = "aac"     # reencode audio codec
     crf: int = 20
     abr_kbps: int = 192
+    hw_accel: str = "CPU"  # CPU or a HW_ENCODERS key
+    start_s: Optional[float] = None  # optional clip range, seconds
+    end_s: Optional[float] = None
     lang_filters: List[str] = field(default_factory=lambda: ["pt", "pt-BR", "en"])  # for subtitles extraction
 
     # Runtime state
@@ -84,11 +132,19 @@ class FFmpegWorker(QtCore.QThread):
     status_signal = QtCore.pyqtSignal(str)         # new status
     finished_signal = QtCore.pyqtSignal(bool, str) # success, message
 
-    def __init__(self, job: Job, ffmpeg_path: str, ffprobe_path: str):
+    def __init__(self, job: Job, ffmpeg_path: str, ffprobe_path: str, threads: int = 0,
+                 probe_cache: Optional[Dict[str, Dict]] = None):
         super().__init__()
         self.job = job
         self.ffmpeg = ffmpeg_path
         self.ffprobe = ffprobe_path
+        self.threads = threads  # 0 = ffmpeg decide
+        self._probe_cache = probe_cache if probe_cache is not None else {}
+        self._last_emit = 0.0
+        self._last_pct = -1
+        # Language filters flattened once per job: every accepted tag, lowercased
+        self._lang_set = frozenset(c.lower() for k in job.lang_filters for c in LANG_MAP.get(k, [k]))
+        self._lang_wild = "*" in job.lang_filters
         self._proc: Optional[subprocess.Popen] = None
         self._cancel = False
 
@@ -101,78 +157,119 @@ class FFmpegWorker(QtCore.QThread):
                 pass
 
     # ---- Core helpers ----
-    def _ffprobe_duration(self, path: str) -> float:
+    def _probe(self, path: str) -> Dict:
+        """Return duration and streams from a single ffprobe call, cached per file."""
+        cached = self._probe_cache.get(path)
+        if cached is not None:
+            return cached
+        cmd = [self.ffprobe, "-v", "error", "-threads", "0"]
+        if os.path.splitext(path)[1].lower() in HEADER_PROBE_EXTS:
+            cmd += ["-probesize", HEADER_PROBE_SIZE, "-analyzeduration", HEADER_PROBE_SIZE]
+        cmd += ["-print_format", "json", "-show_format", "-show_streams", path]
         try:
-            out = subprocess.check_output([
-                self.ffprobe, "-v", "error",
-                "-show_entries", "format=duration",
-                "-of", "default=nw=1:nk=1",
-                path
-            ], stderr=subprocess.STDOUT, text=True)
-            return float(out.strip())
+            out = subprocess.check_output(cmd, **POPEN_KW)
+            data = json.loads(out)  # json accepts the raw UTF-8 bytes
         except Exception:
-            return 0.0
-
-    _time_re = re.compile(r"time=(\d+):(\d+):(\d+\.?\d*)")
-
-    def _parse_progress(self, line: str) -> Optional[float]:
-        m = self._time_re.search(line)
-        if not m:
+            return {"duration": 0.0, "streams": []}
+        try:
+            duration = float(data.get("format", {}).get("duration", 0.0))
+        except (TypeError, ValueError):
+            duration = 0.0
+        info = {"duration": duration, "streams": data.get("streams", [])}
+        self._probe_cache[path] = info
+        return info
+
+    _emit_interval = 0.25  # s (~4 Hz)
+
+    def _parse_progress(self, line: bytes) -> Optional[float]:
+        # key=value record from -progress
+        key, sep, value = line.partition(b"=")
+        if not sep:
             return None
-        h, m_, s = m.groups()
-        seconds = int(h) * 3600 + int(m_) * 60 + float(s)
-        return seconds
+        if key in _PROGRESS_TIME_KEYS:
+            try:
+                return int(value) / 1_000_000
+            except ValueError:  # "N/A" at the start of the file
+                return None
+        return None
+
+    def _base_cmd(self) -> List[str]:
+        """Common ffmpeg prefix: overwrite, thread budget and machine-readable progress."""
+        return [self.ffmpeg, "-y", "-threads", str(self.threads), "-hide_banner",
+                "-nostats", "-progress", "pipe:1"]
+
+    def _input_args(self, src: str, copy: bool) -> List[str]:
+        """-i src plus the job's clip range, if any.
+
+        Stream copy seeks on the input side with -noaccurate_seek (jump to the
+        nearest keyframe, nothing decoded); reencode seeks after -i so the cut
+        is frame-accurate.
+        """
+        rng: List[str] = []
+        if self.job.start_s is not None:
+            rng += ["-ss", f"{self.job.start_s:.3f}"]
+        if self.job.end_s is not None:
+            rng += ["-to", f"{self.job.end_s:.3f}"]
+        if not copy:
+            return ["-i", src] + rng
+        args = ["-fflags", "+genpts"]
+        if rng:
+            args += rng + ["-noaccurate_seek"]
+        return args + ["-i", src]
 
     def _run_ffmpeg(self, args: List[str], duration: float, step_msg: str) -> bool:
         if self._cancel:
             return False
         self.progress_signal.emit(self.job.progress, step_msg)
+        # Structured progress on stdout (see _base_cmd); human-readable stderr is discarded
         self._proc = subprocess.Popen(
             args,
             stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
-            universal_newlines=True,
+            stderr=subprocess.DEVNULL,
+            bufsize=65536,
+            **POPEN_KW,
         )
-        for line in self._proc.stdout:
+        fd = self._proc.stdout.fileno()
+        # Bind hot-loop lookups once
+        parse = self._parse_progress
+        emit = self.progress_signal.emit
+        monotonic = time.monotonic
+        carry = b""
+        while True:
+            chunk = os.read(fd, 4096)
+            if not chunk:
+                break
             if self._cancel:
                 try:
                     self._proc.terminate()
                 except Exception:
                     pass
                 return False
-            # Update progress
-            t = self._parse_progress(line)
+            lines = (carry + chunk).split(b"\n")
+            carry = lines.pop()  # keep the partial line for the next chunk
+            t = None
+            for line in lines:
+                parsed = parse(line.strip())
+                if parsed is not None:
+                    t = parsed
             if duration > 0 and t is not None:
-                pct = min(99, int((t / duration) * 100))
-                self.progress_signal.emit(pct, step_msg)
+                pct = min(99, int(t / duration * 100))
+                now = monotonic()
+                # Only emit when the value moved and the interval elapsed
+                if pct != self._last_pct and now - self._last_emit >= self._emit_interval:
+                    self._last_emit = now
+                    self._last_pct = pct
+                    emit(pct, step_msg)
+        self._proc.stdout.close()
         rc = self._proc.wait()
         return rc == 0
 
     # ---- Build commands per mode ----
-    def _streams_info(self, path: str) -> Dict:
-        try:
-            out = subprocess.check_output([
-                self.ffprobe, "-v", "error",
-                "-print_format", "json",
-                "-show_streams",
-                path
-            ], text=True)
-            return json.loads(out)
-        except Exception:
-            return {"streams": []}
-
     def _match_lang(self, stream: Dict) -> bool:
-        # Accept if no filter set or language matches configured filters
+        # Accept if filter contains wildcard "*" or language matches configured filters
         tags = stream.get("tags", {}) or {}
         lang = (tags.get("language") or tags.get("LANGUAGE") or "").lower()
-        for k in self.job.lang_filters:
-            for cand in LANG_MAP.get(k, [k]):
-                if cand.lower() == lang:
-                    return True
-        # also accept if filter contains wildcard "*"
-        return ("*" in self.job.lang_filters)
+        return self._lang_wild or lang in self._lang_set
 
     def run(self):
         self.status_signal.emit("running")
@@ -182,7 +279,11 @@ class FFmpegWorker(QtCore.QThread):
             os.makedirs(self.job.output_dir, exist_ok=True)
             src = self.job.input_path
             base = os.path.splitext(os.path.basename(src))[0]
-            duration = self._ffprobe_duration(src)
+            duration = self._probe(src)["duration"]
+            if self.job.start_s is not None or self.job.end_s is not None:
+                # Progress is relative to the clipped output
+                end = self.job.end_s if self.job.end_s is not None else duration
+                duration = max(0.0, end - (self.job.start_s or 0.0))
 
             if self.job.mode == "extract":
                 ok, msg = self._do_extract(src, base, duration)
@@ -206,42 +307,47 @@ class FFmpegWorker(QtCore.QThread):
 
     # ---- Extract modes ----
     def _do_extract(self, src: str, base: str, duration: float) -> Tuple[bool, str]:
-        info = self._streams_info(src)
+        info = self._probe(src)
         streams = info.get("streams", [])
         video_idxs = [s["index"] for s in streams if s.get("codec_type") == "video"]
         audio_idxs = [s["index"] for s in streams if s.get("codec_type") == "audio"]
-        sub_idxs = [s["index"] for s in streams if s.get("codec_type") == "subtitle" and self._match_lang(s)]
+        subs = [s for s in streams if s.get("codec_type") == "subtitle" and self._match_lang(s)]
+        sub_idxs = [s["index"] for s in subs]
+        # Only text subtitles can become .srt; image ones are skipped for separate outputs
+        srt_idxs = [s["index"] for s in subs if s.get("codec_name") in TEXT_SUB_CODECS]
+        skipped = len(sub_idxs) - len(srt_idxs)
+        skipped_note = f" ({skipped} legenda(s) de imagem ignorada(s))" if skipped else ""
 
         # Determine container for unified remux (MKV is safest for copy of many codecs)
         unified_container = "mkv"
 
         if self.job.extract_variant == "sep_tracks":
+            # One ffmpeg pass, one output per track: the source is demuxed only once
+            args = self._base_cmd() + self._input_args(src, copy=True)
+
             # 1) video-only MP4
             dst_v = os.path.join(self.job.output_dir, f"{base}.video.mp4")
-            args_v = [self.ffmpeg, "-y", "-i", src, "-map", f"0:v:0", "-c", "copy", dst_v]
-            if not self._run_ffmpeg(args_v, duration, "Extraindo vídeo…"):
-                return False, "Falha ao extrair vídeo"
+            args += ["-map", "0:v:0", "-c", "copy", "-avoid_negative_ts", "make_zero", dst_v]
 
             # 2) each audio stream to individual file preserving codec
             for i, a_idx in enumerate(audio_idxs):
                 dst_a = os.path.join(self.job.output_dir, f"{base}.audio{ i+1 }.mka")
-                args_a = [self.ffmpeg, "-y", "-i", src, "-map", f"0:{a_idx}", "-c", "copy", dst_a]
-                if not self._run_ffmpeg(args_a, duration, f"Extraindo áudio {i+1}…"):
-                    return False, f"Falha ao extrair áudio {i+1}"
+                args += ["-map", f"0:{a_idx}", "-c", "copy", "-avoid_negative_ts", "make_zero", dst_a]
 
             # 3) selected subtitles to .srt
-            if sub_idxs:
-                for k, s_idx in enumerate(sub_idxs):
-                    dst_s = os.path.join(self.job.output_dir, f"{base}.sub{ k+1 }.srt")
-                    args_s = [self.ffmpeg, "-y", "-i", src, "-map", f"0:{s_idx}", dst_s]
-                    if not self._run_ffmpeg(args_s, duration, f"Extraindo legenda {k+1}…"):
-                        return False, f"Falha ao extrair legenda {k+1}"
-            return True, "Extração concluída (faixas separadas)"
+            for k, s_idx in enumerate(srt_idxs):
+                dst_s = os.path.join(self.job.output_dir, f"{base}.sub{ k+1 }.srt")
+                args += ["-map", f"0:{s_idx}", "-c:s", "srt", dst_s]
+
+            if not self._run_ffmpeg(args, duration, "Extraindo faixas…"):
+                return False, "Falha ao extrair faixas"
+            return True, "Extração concluída (faixas separadas)" + skipped_note
 
         elif self.job.extract_variant == "vid_aud__leg":
-            # Remux video+all audio, plus separate .srt files for chosen subs
+            # Remux video+all audio, plus separate .srt files for chosen subs, in one pass
             dst = os.path.join(self.job.output_dir, f"{base}.{unified_container}")
-            args = [self.ffmpeg, "-y", "-i", src, "-c", "copy"]
+            args = self._base_cmd() + self._input_args(src, copy=True)
+            args += ["-c", "copy", "-avoid_negative_ts", "make_zero"]
             # map video
             if video_idxs:
                 args += ["-map", f"0:{video_idxs[0]}"]
@@ -249,20 +355,18 @@ class FFmpegWorker(QtCore.QThread):
             for a_idx in audio_idxs:
                 args += ["-map", f"0:{a_idx}"]
             args += [dst]
-            if not self._run_ffmpeg(args, duration, "Remux: vídeo+áudio…"):
-                return False, "Falha no remux vídeo+áudio"
-
-            # Extract subs
-            for k, s_idx in enumerate(sub_idxs):
+            # Subtitles as extra outputs of the same run: one read of the source
+            for k, s_idx in enumerate(srt_idxs):
                 dst_s = os.path.join(self.job.output_dir, f"{base}.sub{ k+1 }.srt")
-                args_s = [self.ffmpeg, "-y", "-i", src, "-map", f"0:{s_idx}", dst_s]
-                if not self._run_ffmpeg(args_s, duration, f"Extraindo legenda {k+1}…"):
-                    return False, f"Falha ao extrair legenda {k+1}"
-            return True, "Remux (vídeo+áudio) e legendas separadas concluídos"
+                args += ["-map", f"0:{s_idx}", "-c:s", "srt", dst_s]
+            if not self._run_ffmpeg(args, duration, "Remux: vídeo+áudio e legendas…"):
+                return False, "Falha no remux vídeo+áudio/legendas"
+            return True, "Remux (vídeo+áudio) e legendas separadas concluídos" + skipped_note
 
         else:  # vid_aud_leg_unified
             dst = os.path.join(self.job.output_dir, f"{base}.{unified_container}")
-            args = [self.ffmpeg, "-y", "-i", src, "-c", "copy"]
+            args = self._base_cmd() + self._input_args(src, copy=True)
+            args += ["-c", "copy", "-avoid_negative_ts", "make_zero"]
             # map video
             if video_idxs:
                 args += ["-map", f"0:{video_idxs[0]}"]
@@ -285,13 +389,25 @@ class FFmpegWorker(QtCore.QThread):
         vcodec = self.job.target_codec_v
         acodec = self.job.target_codec_a
 
-        args = [
-            self.ffmpeg, "-y", "-i", src,
-            "-c:v", vcodec,
-            "-crf", str(self.job.crf),
-            "-preset", "veryfast",
-            "-c:a", acodec,
-        ]
+        hw = HW_ENCODERS.get(self.job.hw_accel, {})
+        hw_vcodec = hw.get(vcodec.lower())
+
+        args = self._base_cmd()
+        if hw_vcodec:
+            # Offload decoding as well; ffmpeg falls back to software if unsupported
+            args += ["-hwaccel", "auto"]
+        args += self._input_args(src, copy=False)
+        # CRF has no HW equivalent; map it onto each encoder's constant-quality mode
+        if not hw_vcodec:
+            args += ["-c:v", vcodec, "-crf", str(self.job.crf), "-preset", "veryfast"]
+        elif self.job.hw_accel == "NVENC":
+            args += ["-c:v", hw_vcodec, "-rc", "vbr", "-cq", str(self.job.crf), "-b:v", "0", "-preset", "p4"]
+        elif self.job.hw_accel == "QSV":
+            args += ["-c:v", hw_vcodec, "-global_quality", str(self.job.crf), "-preset", "veryfast"]
+        else:  # AMF
+            args += ["-c:v", hw_vcodec, "-rc", "cqp",
+                     "-qp_i", str(self.job.crf), "-qp_p", str(self.job.crf)]
+        args += ["-c:a", acodec]
         # If AAC, set bitrate
         if acodec.lower() == "aac":
             args += ["-b:a", f"{self.job.abr_kbps}k"]
@@ -325,8 +441,32 @@ class MainWindow(QtWidgets.QMainWindow):
             QtWidgets.QMessageBox.warning(self, "FFmpeg não encontrado",
                 "Instale o FFmpeg e garanta que 'ffmpeg' e 'ffprobe' estejam no PATH.")
 
-        self._jobs: List[Job] = []
-        self._workers: Dict[int, FFmpegWorker] = {}
+        # Queue in SoA form: parallel per-row columns. Rows shift when cleared, so
+        # everything else (workers, scheduler, progress) is keyed by a stable job id.
+        self._job_ids: List[int] = []
+        self._job_status: List[str] = []
+        self._job_progress: List[int] = []
+        self._jobs: List[Job] = []  # per-row job settings handed to the worker
+        # Table items owned by each row, updated in place with setText
+        self._status_items: List[QtWidgets.QTableWidgetItem] = []
+        self._msg_items: List[QtWidgets.QTableWidgetItem] = []
+        self._next_job_id = 0
+        self._workers: Dict[int, FFmpegWorker] = {}  # job id -> worker
+        self._probe_cache: Dict[str, Dict] = {}  # path -> {"duration", "streams"}
+
+        # Scheduler: cap how many ffmpeg processes run at once
+        cpus = os.cpu_count() or 2
+        self._max_parallel = max(1, cpus // 2)
+        self._thread_budget = max(1, cpus // self._max_parallel)  # threads per ffmpeg
+        self._pending: deque = deque()
+        self._active: set = set()
+
+        # Progress coalescing: workers only record the latest value, a 10 Hz timer paints it
+        self._progress_updates: Dict[int, Tuple[int, str]] = {}
+        self._progress_timer = QtCore.QTimer(self)
+        self._progress_timer.setInterval(100)
+        self._progress_timer.timeout.connect(self._flush_progress)
+        self._progress_timer.start()
 
         self._build_ui()
 
@@ -410,8 +550,14 @@ class MainWindow(QtWidgets.QMainWindow):
         reenc_layout.addWidget(self.combo_acodec, 2, 1)
         reenc_layout.addWidget(QtWidgets.QLabel("CRF:"), 3, 0)
         reenc_layout.addWidget(self.spin_crf, 3, 1)
+        self.combo_hwaccel = QtWidgets.QComboBox()
+        self.combo_hwaccel.addItem("CPU")
+        if self.ffmpeg:
+            self.combo_hwaccel.addItems(list(available_hw_accels(self.ffmpeg)))
         reenc_layout.addWidget(QtWidgets.QLabel("Áudio (kbps):"), 4, 0)
         reenc_layout.addWidget(self.spin_abr, 4, 1)
+        reenc_layout.addWidget(QtWidgets.QLabel("Aceleração:"), 5, 0)
+        reenc_layout.addWidget(self.combo_hwaccel, 5, 1)
         layout.addWidget(reenc_box)
 
         # Queue table
@@ -487,6 +633,7 @@ class MainWindow(QtWidgets.QMainWindow):
             target_codec_a=self.combo_acodec.currentText(),
             crf=self.spin_crf.value(),
             abr_kbps=self.spin_abr.value(),
+            hw_accel=self.combo_hwaccel.currentText(),
             lang_filters=self._gather_langs(),
         )
         return job
@@ -496,8 +643,11 @@ class MainWindow(QtWidgets.QMainWindow):
         if not in_dir or not os.path.isdir(in_dir):
             QtWidgets.QMessageBox.warning(self, "Pasta inválida", "Selecione uma pasta de entrada válida.")
             return
-        files = [os.path.join(in_dir, f) for f in os.listdir(in_dir)
-                 if os.path.splitext(f)[1].lower() in VIDEO_EXTS]
+        # scandir entries carry the file type from readdir, so no extra stat per file
+        with os.scandir(in_dir) as it:
+            files = [e.path for e in it
+                     if e.name.lower().endswith(_VIDEO_SUFFIXES)
+                     and e.is_file(follow_symlinks=False)]
         if not files:
             QtWidgets.QMessageBox.information(self, "Nada encontrado", "Nenhum vídeo suportado na pasta.")
             return
@@ -505,21 +655,26 @@ class MainWindow(QtWidgets.QMainWindow):
             self._append_job(self._build_job_for_file(f))
 
     def _append_job(self, job: Job):
+        job_id = self._next_job_id
+        self._next_job_id += 1
+
         row = self.table.rowCount()
         self.table.insertRow(row)
         self.table.setItem(row, 0, QtWidgets.QTableWidgetItem(os.path.basename(job.input_path)))
-        self.table.setItem(row, 1, QtWidgets.QTableWidgetItem(job.status))
+        status_item = QtWidgets.QTableWidgetItem(job.status)
+        self.table.setItem(row, 1, status_item)
 
         # progress bar
         pbar = QtWidgets.QProgressBar()
         pbar.setValue(0)
         self.table.setCellWidget(row, 2, pbar)
 
-        self.table.setItem(row, 3, QtWidgets.QTableWidgetItem(""))
+        msg_item = QtWidgets.QTableWidgetItem("")
+        self.table.setItem(row, 3, msg_item)
 
         # actions: cancel button
         btn_cancel = QtWidgets.QPushButton("Cancelar")
-        btn_cancel.clicked.connect(lambda _, r=row: self.cancel_job(r))
+        btn_cancel.clicked.connect(lambda _, j=job_id: self.cancel_job(j))
         w = QtWidgets.QWidget()
         hl = QtWidgets.QHBoxLayout(w)
         hl.setContentsMargins(0, 0, 0, 0)
@@ -527,10 +682,21 @@ class MainWindow(QtWidgets.QMainWindow):
         hl.addStretch(1)
         self.table.setCellWidget(row, 4, w)
 
+        self._job_ids.append(job_id)
+        self._job_status.append(job.status)
+        self._job_progress.append(0)
         self._jobs.append(job)
+        self._status_items.append(status_item)
+        self._msg_items.append(msg_item)
 
-    def cancel_job(self, row: int):
-        worker = self._workers.get(row)
+    def _row_of(self, job_id: int) -> Optional[int]:
+        try:
+            return self._job_ids.index(job_id)
+        except ValueError:
+            return None  # row was cleared
+
+    def cancel_job(self, job_id: int):
+        worker = self._workers.get(job_id)
         if worker:
             worker.cancel()
 
@@ -539,49 +705,94 @@ class MainWindow(QtWidgets.QMainWindow):
             QtWidgets.QMessageBox.warning(self, "FFmpeg/FFprobe ausentes",
                                           "Instale FFmpeg/FFprobe e coloque no PATH.")
             return
-        for row, job in enumerate(self._jobs):
-            if job.status in ("done", "running"):
+        for job_id, status in zip(self._job_ids, self._job_status):
+            if status in ("done", "running"):
+                continue
+            if job_id in self._active or job_id in self._pending:
                 continue
-            self._run_row(row, job)
+            self._pending.append(job_id)
+        self._pump()
+
+    def _pump(self):
+        # Start workers until the parallelism cap is reached
+        while self._pending and len(self._active) < self._max_parallel:
+            job_id = self._pending.popleft()
+            row = self._row_of(job_id)
+            if row is None or self._job_status[row] in ("done", "running"):
+                continue
+            self._active.add(job_id)
+            self._run_job(job_id, self._jobs[row])
 
-    def _run_row(self, row: int, job: Job):
-        worker = FFmpegWorker(job, self.ffmpeg, self.ffprobe)
-        self._workers[row] = worker
+    def _run_job(self, job_id: int, job: Job):
+        worker = FFmpegWorker(job, self.ffmpeg, self.ffprobe, self._thread_budget, self._probe_cache)
+        self._workers[job_id] = worker
 
         def on_progress(pct: int, msg: str):
-            pbar = self.table.cellWidget(row, 2)
-            if isinstance(pbar, QtWidgets.QProgressBar):
-                pbar.setValue(pct)
-            self.table.setItem(row, 3, QtWidgets.QTableWidgetItem(msg))
+            self._progress_updates[job_id] = (pct, msg)
 
         def on_status(st: str):
-            self.table.setItem(row, 1, QtWidgets.QTableWidgetItem(st))
+            row = self._row_of(job_id)
+            if row is None:
+                return
+            self._job_status[row] = st
+            self._status_items[row].setText(st)
 
         def on_finished(success: bool, message: str):
-            self.table.setItem(row, 3, QtWidgets.QTableWidgetItem(message))
-            pbar = self.table.cellWidget(row, 2)
-            if isinstance(pbar, QtWidgets.QProgressBar):
-                pbar.setValue(100 if success else pbar.value())
+            self._progress_updates.pop(job_id, None)  # drop stale progress
+            self._active.discard(job_id)
+            row = self._row_of(job_id)
+            if row is not None:
+                self._msg_items[row].setText(message)
+                if success:
+                    self._job_progress[row] = 100
+                pbar = self.table.cellWidget(row, 2)
+                if isinstance(pbar, QtWidgets.QProgressBar):
+                    pbar.setValue(self._job_progress[row])
+            self._pump()
 
         worker.progress_signal.connect(on_progress)
         worker.status_signal.connect(on_status)
         worker.finished_signal.connect(on_finished)
         worker.start()
 
+    def _flush_progress(self):
+        if not self._progress_updates:
+            return
+        updates, self._progress_updates = self._progress_updates, {}
+        for job_id, (pct, msg) in updates.items():
+            row = self._row_of(job_id)
+            if row is None:
+                continue
+            self._job_progress[row] = pct
+            pbar = self.table.cellWidget(row, 2)
+            if isinstance(pbar, QtWidgets.QProgressBar):
+                pbar.setValue(pct)
+            self._msg_items[row].setText(msg)
+
     def clear_done(self):
-        # remove rows with status done or error
-        to_remove = []
-        for r in range(self.table.rowCount()):
-            st_item = self.table.item(r, 1)
-            if st_item and st_item.text() in ("done", "error", "canceled"):
-                to_remove.append(r)
-        for idx in reversed(to_remove):
-            self.table.removeRow(idx)
-            try:
-                self._jobs.pop(idx)
-                self._workers.pop(idx, None)
-            except Exception:
-                pass
+        # remove rows with status done, error or canceled
+        to_remove = [r for r, st in enumerate(self._job_status)
+                     if st in ("done", "error", "canceled")]
+        if not to_remove:
+            return
+        # Group into contiguous runs so each run is a single model shift
+        runs = []  # (first, count)
+        for r in to_remove:
+            if runs and runs[-1][0] + runs[-1][1] == r:
+                runs[-1] = (runs[-1][0], runs[-1][1] + 1)
+            else:
+                runs.append((r, 1))
+        model = self.table.model()
+        for first, count in reversed(runs):
+            model.removeRows(first, count)
+            for job_id in self._job_ids[first:first + count]:
+                self._workers.pop(job_id, None)
+            del self._job_ids[first:first + count]
+            del self._job_status[first:first + count]
+            del self._job_progress[first:first + count]
+            del self._jobs[first:first + count]
+            del self._status_items[first:first + count]
+            del self._msg_items[first:first + count]
 
 
 def main():
@@ -6,7 +6,8 @@ Features requested:
 - Default: Apenas Extração/Remux (Vid/Aud unificados em mp4 quando possível + legendas .srt separadas)
 - Pre-seleção de legendas: pt-BR e en
 - Reencode: mais codecs suportados (video: h264/hevc/mpeg2/mpeg1; audio: aac/ac3/mp3/vorbis/opus)
-- Fila serial (não paralela)
+- Encoders de GPU (NVENC/QSV/VAAPI/VideoToolbox) quando o ffmpeg os oferece
+- Fila paralela (N jobs simultâneos, configurável; padrão núcleos/4)
 - Popula codecs e legendas via ffprobe ao adicionar à fila
 - Permite remoção manual de itens da fila
 - Confirma espaço disponível na pasta de destino
@@ -20,10 +21,27 @@ import os
 import sys
 import json
 import shutil
+import shelve
+import threading
+import time
+import itertools
 import subprocess
-import re
-from dataclasses import dataclass, field
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+try:
+    import fcntl  # POSIX only
+except ImportError:
+    fcntl = None
+try:
+    import orjson  # optional: faster ffprobe JSON parsing
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads  # also accepts bytes
+try:
+    import av  # optional: PyAV probes in-process (libavformat loaded once) instead of spawning ffprobe
+except ImportError:
+    av = None
+from dataclasses import dataclass, field, asdict
+from typing import Dict, List, Optional
 
 from PyQt6 import QtWidgets, QtCore, QtGui
 
@@ -46,41 +64,179 @@ def readable_size(n):
     return f"{n:.1f}PB"
 
 def run_ffprobe_collect_streams(path):
+    # streams and container duration from a single ffprobe call
     try:
-        out = subprocess.check_output([FFPROBE, "-v", "error", "-print_format", "json", "-show_streams", path], text=True)
-        info = json.loads(out)
+        out = subprocess.check_output([FFPROBE, "-v", "error", "-print_format", "json", "-show_streams", "-show_format", path])
+        info = json_loads(out)
         streams = info.get("streams", [])
-        return streams, None
+        try:
+            duration = float(info.get("format", {}).get("duration", 0.0))
+        except (TypeError, ValueError):
+            duration = 0.0
+        return streams, duration, None
     except Exception as e:
-        return None, str(e)
-
-def probe_duration(path):
+        return None, 0.0, str(e)
+
+# text subtitle codec -> (file extension, -c:s); these are written as-is
+TEXT_SUB_OUTPUT = {
+    "subrip": ("srt", "copy"),
+    "ass": ("ass", "copy"),
+    "ssa": ("ass", "copy"),
+    "webvtt": ("vtt", "copy"),
+    "mov_text": ("srt", "srt"),  # the srt muxer won't take mov_text packets; cheap text->text
+}
+IMAGE_SUB_CODECS = frozenset({"hdmv_pgs_subtitle", "dvd_subtitle", "dvb_subtitle", "xsub"})
+
+# output extension -> ffmpeg muxer (outputs are written as name.ext.part, see JobRunnable._out)
+OUTPUT_MUXERS = {"mp4": "mp4", "mkv": "matroska", "mka": "matroska", "avi": "avi",
+                 "srt": "srt", "ass": "ass", "vtt": "webvtt"}
+
+def same_file_path(a, b):
+    return os.path.normcase(os.path.realpath(a)) == os.path.normcase(os.path.realpath(b))
+
+# GPU encoders offered in the video combo when this ffmpeg build has them
+HW_VENCODERS = ("h264_nvenc","hevc_nvenc","h264_qsv","hevc_qsv","h264_vaapi","hevc_vaapi","h264_videotoolbox","hevc_videotoolbox")
+VAAPI_DEVICE = "/dev/dri/renderD128"
+
+def detect_encoders():
+    """Return the HW_VENCODERS compiled into ffmpeg (run once at startup)."""
+    if not FFMPEG:
+        return ()
+    try:
+        out = subprocess.check_output([FFMPEG,"-hide_banner","-encoders"], text=True, stderr=subprocess.DEVNULL)
+    except Exception:
+        return ()
+    names = set()
+    for line in out.splitlines():
+        parts = line.split()
+        # encoder rows look like " V....D h264_nvenc  NVIDIA NVENC H.264 encoder"
+        if len(parts) > 1 and parts[0].startswith("V"):
+            names.add(parts[1])
+    return tuple(e for e in HW_VENCODERS if e in names)
+
+def video_encode_args(vcodec, crf):
+    """(input_args, output_args) for vcodec, with CRF translated to the encoder's rate control."""
+    if vcodec.endswith("_nvenc"):
+        return [], ["-c:v",vcodec,"-rc","vbr","-cq",str(crf),"-b:v","0","-preset","p4","-tune","hq"]
+    if vcodec.endswith("_qsv"):
+        return [], ["-c:v",vcodec,"-global_quality",str(crf),"-preset","veryfast"]
+    if vcodec.endswith("_vaapi"):
+        return ["-vaapi_device",VAAPI_DEVICE], ["-vf","format=nv12,hwupload","-c:v",vcodec,"-qp",str(crf)]
+    if vcodec.endswith("_videotoolbox"):
+        # -q:v runs 1..100, higher is better: rough inverse of the CRF scale
+        return [], ["-c:v",vcodec,"-q:v",str(max(1, min(100, 100 - 2*crf)))]
+    return [], ["-c:v",vcodec,"-crf",str(crf),"-preset","veryfast"]
+
+# encoder name (as offered in the combos) -> codec_name ffprobe reports for its output
+ENCODER_CODECS = {"libx264": "h264", "libx265": "hevc", "libvorbis": "vorbis", "libopus": "opus"}
+
+def encoder_codec(encoder):
+    # h264_nvenc -> h264, hevc_qsv -> hevc; native encoders (aac, ac3, mp3, mpeg2video) share the codec name
+    if encoder in ENCODER_CODECS:
+        return ENCODER_CODECS[encoder]
+    return encoder.split("_")[0]
+
+# ffprobe results survive across sessions; keyed by path + mtime + size so edits invalidate them
+PROBE_CACHE_PATH = os.path.expanduser("~/.cache/vidtrans/probe.db")
+
+def _open_probe_cache():
     try:
-        out = subprocess.check_output([FFPROBE,"-v","error","-show_entries","format=duration","-of","default=nw=1:nk=1",path], text=True)
-        return float(out.strip())
+        os.makedirs(os.path.dirname(PROBE_CACHE_PATH), exist_ok=True)
+        return shelve.open(PROBE_CACHE_PATH)
     except Exception:
-        return 0.0
+        return None  # unwritable home / broken db: just probe every time
 
-_time_re = re.compile(r"time=(\d+):(\d+):(\d+\.?\d*)")
-def parse_ffmpeg_time(line):
-    m = _time_re.search(line)
-    if not m:
+_probe_cache = _open_probe_cache()
+_probe_cache_lock = threading.Lock()  # shelve is not thread-safe
+
+def probe_file_cached(path, st=None):
+    """Return (streams: List[StreamInfo], duration, err), reusing cached probes of unchanged files.
+
+    st: os.stat_result for path when the caller already has one (e.g. from scandir)."""
+    try:
+        st = st or os.stat(path)
+    except OSError as e:
+        return None, 0.0, str(e)
+    key = f"{os.path.abspath(path)}:{st.st_mtime_ns}:{st.st_size}"
+    if _probe_cache is not None:
+        with _probe_cache_lock:
+            hit = _probe_cache.get(key)
+        if hit is not None:
+            streams, duration = hit
+            return [StreamInfo(**d) for d in streams], duration, None
+
+    raw, duration, err = probe_streams(path)
+    if err or raw is None:
+        return None, 0.0, err
+    streams = []
+    for s in raw:
+        tags = s.get("tags") or {}
+        lang = tags.get("language") or tags.get("LANGUAGE")
+        streams.append(StreamInfo(index=s.get("index"), codec_type=s.get("codec_type"), codec_name=s.get("codec_name"), language=lang,
+                                  width=s.get("width"), height=s.get("height")))
+    if _probe_cache is not None:
+        with _probe_cache_lock:
+            _probe_cache[key] = ([asdict(si) for si in streams], duration)
+    return streams, duration, None
+
+def probe_av(path):
+    """PyAV equivalent of run_ffprobe_collect_streams: ffprobe-shaped stream dicts and duration."""
+    with av.open(path) as c:
+        streams = []
+        for st in c.streams:
+            cc = st.codec_context
+            d = {"index": st.index, "codec_type": st.type, "codec_name": cc.name if cc else None,
+                 "tags": dict(st.metadata)}
+            if st.type == "video":
+                d["width"], d["height"] = cc.width, cc.height
+            streams.append(d)
+        duration = c.duration / av.time_base if c.duration else 0.0
+    return streams, duration, None
+
+def probe_streams(path):
+    # PyAV when available; ffprobe as fallback (not installed, or it can't open the file)
+    if av is not None:
+        try:
+            return probe_av(path)
+        except Exception:
+            pass
+    return run_ffprobe_collect_streams(path)
+
+def parse_progress(line):
+    # key=value records (bytes) from ffmpeg -progress; out_time_us is the output position
+    if not line.startswith(b"out_time_us="):
+        return None
+    try:
+        return int(line[12:]) / 1e6
+    except ValueError:  # "N/A" before the first packet
         return None
-    h, mm, ss = m.groups()
-    return int(h)*3600 + int(mm)*60 + float(ss)
+
+def _grow_pipe(fd, size=1 << 20):
+    # Linux only: a 1 MiB pipe instead of the default 64 KiB so ffmpeg never blocks on us
+    setpipe = getattr(fcntl, "F_SETPIPE_SZ", None) if fcntl else None
+    if setpipe is None:
+        return
+    try:
+        fcntl.fcntl(fd, setpipe, size)
+    except OSError:
+        pass  # above /proc/sys/fs/pipe-max-size; keep the default
 
 # -------------------------
 # Data models
 # -------------------------
 
-@dataclass
+_job_ids = itertools.count(1)
+
+@dataclass(slots=True)
 class StreamInfo:
     index: int
     codec_type: str
     codec_name: str
     language: Optional[str] = None
+    width: Optional[int] = None  # video only
+    height: Optional[int] = None
 
-@dataclass
+@dataclass(slots=True)
 class Job:
     input_path: str
     out_dir: str
@@ -92,31 +248,73 @@ class Job:
     crf: int = 20
     abr_kbps: int = 192
     lang_filters: List[str] = field(default_factory=lambda: ["por","pob", "pt", "pt-br"])
+    # lowercased filters plus their base language ("pt-br" -> "pt"); built once in add_from_input
+    _lang_set: frozenset = frozenset()
 
     # populated by ffprobe
-    streams: List[StreamInfo] = field(default_factory=list)
+    # split by type once at probe time (stream order kept), plus the table's display strings
+    video_streams: List[StreamInfo] = field(default_factory=list)
+    audio_streams: List[StreamInfo] = field(default_factory=list)
+    subtitle_streams: List[StreamInfo] = field(default_factory=list)
+    vcodecs_str: str = ""
+    acodecs_str: str = ""
+    subs_str: str = ""
     filesize: int = 0
     duration: float = 0.0
+    est_out_size: int = 0  # expected bytes written to out_dir (see estimate_out_size)
 
     # runtime
     status: str = "queued"  # queued, incompatible, running, done, error, skipped
+    progress: int = 0  # percent, drawn by JobDelegate
+    # stable key for runners and worker signals; table rows shift when items are removed
+    job_id: int = field(default_factory=lambda: next(_job_ids))
     message: str = ""
     skip_if_incompatible: bool = False
 
+def _video_bytes_per_s(crf, width, height):
+    # rough CRF model: ~0.1 bits/pixel at CRF 23 and 30 fps, doubling every 6 CRF steps
+    w = width or 1920
+    h = height or 1080
+    bpp = 0.1 * 2 ** ((23 - crf) / 6)
+    return w * h * 30 * bpp / 8
+
+def estimate_out_size(job: Job):
+    """Bytes a job is expected to write: the input size for remux/extract, bitrate x duration for reencode."""
+    if job.mode == "extract":
+        return job.filesize
+    v = job.video_streams[0] if job.video_streams else None
+    video = _video_bytes_per_s(job.crf, v.width if v else None, v.height if v else None)
+    return int(job.duration * (job.abr_kbps * 125 + video))
+
 # -------------------------
-# Worker: single job processor
+# Worker: single job processor (runs on the shared QThreadPool)
 # -------------------------
 
-class JobWorker(QtCore.QThread):
-    progress = QtCore.pyqtSignal(int, str)  # percent, message
-    finished = QtCore.pyqtSignal(bool, str)  # success, message
-    status_changed = QtCore.pyqtSignal(str)
+CPU_COUNT = os.cpu_count() or 1
+PROGRESS_INTERVAL = 0.1  # seconds between progress signals to the GUI (<= 10 Hz)
+
+class JobSignals(QtCore.QObject):
+    # QRunnable is not a QObject, so its signals live on this helper
+    # every signal carries Job.job_id first; the slot looks up the job's current row
+    progress = QtCore.pyqtSignal(int, int, str)  # job_id, percent, message
+    finished = QtCore.pyqtSignal(int, bool, str)  # job_id, success, message
+    status_changed = QtCore.pyqtSignal(int, str)  # job_id, message
 
-    def __init__(self, job: Job):
+class JobRunnable(QtCore.QRunnable):
+    def __init__(self, job: Job, threads: int):
         super().__init__()
+        # we keep our own reference in MainWindow.runners; don't let Qt delete it under us
+        self.setAutoDelete(False)
         self.job = job
+        self.threads = threads  # ffmpeg -threads, scaled to cores / concurrency
+        self.job_id = job.job_id
+        self.signals = JobSignals()
         self._proc = None
         self._cancel = False
+        self._parts = []  # (path.part, path) outputs of the command being built
+        # progress throttle: at most one signal per PROGRESS_INTERVAL and only on change
+        self._last_emit_t = 0.0
+        self._last_pct = -1
 
     def cancel(self):
         self._cancel = True
@@ -126,26 +324,78 @@ class JobWorker(QtCore.QThread):
             except Exception:
                 pass
 
+    def _out(self, path):
+        # ffmpeg output args writing to path.part; the muxer is explicit since ".part" says nothing.
+        # ffmpeg never sees the final name, so its "output same as input" refusal can't fire:
+        # never let os.replace land on the source (out_dir defaults to in_dir)
+        if same_file_path(path, self.job.input_path):
+            root, ext = os.path.splitext(path)
+            path = f"{root}_out{ext}"
+        tmp = path + ".part"
+        self._parts.append((tmp, path))
+        return ["-f", OUTPUT_MUXERS[os.path.splitext(path)[1][1:].lower()], tmp]
+
     def _run_process_and_track(self, args, duration, step_msg):
-        # spawn ffmpeg, parse output for time= and update percent
+        # outputs only appear under their final names once ffmpeg succeeded;
+        # failures and cancels leave no half-written files behind
+        parts, self._parts = self._parts, []
+        committed = False
         try:
-            self.status_changed.emit(step_msg)
-            self._proc = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1)
+            ok = self._track_ffmpeg(args, duration, step_msg)
+            if ok:
+                for tmp, final in parts:
+                    os.replace(tmp, final)
+                committed = True
+            return ok
+        finally:
+            if not committed:
+                for tmp, _ in parts:
+                    try:
+                        os.unlink(tmp)
+                    except OSError:
+                        pass
+
+    def _track_ffmpeg(self, args, duration, step_msg):
+        # spawn ffmpeg, parse -progress records from stdout and update percent
+        try:
+            self.signals.status_changed.emit(self.job_id, step_msg)
+            # machine-readable progress on stdout; stderr carries nothing we read
+            args = [args[0], "-progress", "pipe:1", "-nostats", *args[1:]]
+            self._proc = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, bufsize=1024*1024)
         except FileNotFoundError:
-            self.progress.emit(0, "ffmpeg não encontrado")
+            self.signals.progress.emit(self.job_id, 0, "ffmpeg não encontrado")
             return False
 
-        for line in self._proc.stdout:
+        fd = self._proc.stdout.fileno()
+        _grow_pipe(fd)
+        carry = b""
+        while True:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                break
             if self._cancel:
                 try:
                     self._proc.terminate()
                 except Exception:
                     pass
+                self._proc.stdout.close()
+                self._proc.wait()
                 return False
-            t = parse_ffmpeg_time(line)
+            lines = (carry + chunk).split(b"\n")
+            carry = lines.pop()  # partial record, completed by the next read
+            t = None
+            for line in lines:
+                parsed = parse_progress(line)
+                if parsed is not None:
+                    t = parsed  # only the newest position in this chunk matters
             if t is not None and duration > 0:
                 pct = min(99, int((t/duration)*100))
-                self.progress.emit(pct, step_msg)
+                now = time.monotonic()
+                if pct != self._last_pct and now - self._last_emit_t > PROGRESS_INTERVAL:
+                    self.signals.progress.emit(self.job_id, pct, step_msg)
+                    self._last_emit_t = now
+                    self._last_pct = pct
+        self._proc.stdout.close()
         rc = self._proc.wait()
         return rc == 0
 
@@ -153,31 +403,49 @@ class JobWorker(QtCore.QThread):
         if not lang:
             return False
         lang = lang.lower()
-        for lf in self.job.lang_filters:
-            for cand in (lf.lower(), lf.split("-")[0].lower()):
-                if cand in lang:
-                    return True
-        return False
+        return any(cand in lang for cand in self.job._lang_set)
+
+    def _sub_outputs(self, base, subtitle_streams, thr):
+        # extra ffmpeg outputs, one per subtitle matching the language filters;
+        # returns (args, number of image subtitles skipped)
+        args = []
+        s_count = 0
+        skipped = 0
+        for s in subtitle_streams:
+            if not self._match_sub_lang(s.language):
+                continue
+            if s.codec_name in IMAGE_SUB_CODECS:
+                # bitmap subs can't become text without OCR; don't start a doomed output
+                skipped += 1
+                continue
+            ext, codec = TEXT_SUB_OUTPUT.get(s.codec_name, ("srt", "srt"))
+            out_s = os.path.join(self.job.out_dir, f"{base}.{s.language or 'sub'}.{s_count+1}.{ext}")
+            args += ["-map",f"0:{s.index}","-c:s",codec,*thr,*self._out(out_s)]
+            s_count += 1
+        return args, skipped
+
+    @staticmethod
+    def _skipped_note(skipped):
+        return f" ({skipped} legenda(s) de imagem ignorada(s))" if skipped else ""
 
     def run(self):
         job = self.job
         job.status = "running"
-        self.status_changed.emit("running")
-        duration = job.duration or probe_duration(job.input_path)
-        job.duration = duration
+        self.signals.status_changed.emit(self.job_id, "running")
+        duration = job.duration
 
         # Simple compatibility guard: must have at least one video stream
-        video_streams = [s for s in job.streams if s.codec_type == "video"]
-        audio_streams = [s for s in job.streams if s.codec_type == "audio"]
-        subtitle_streams = [s for s in job.streams if s.codec_type == "subtitle"]
+        video_streams = job.video_streams
+        audio_streams = job.audio_streams
+        subtitle_streams = job.subtitle_streams
 
         if not video_streams:
-            self.finished.emit(False, "Sem faixa de vídeo")
+            self.signals.finished.emit(self.job_id, False, "Sem faixa de vídeo")
             return
 
         # Determine container friendliness for mp4
-        mp4_vid_ok = any(s.codec_name in ("h264","mpeg4","mpeg2video","mpeg1video","hevc") for s in job.streams if s.codec_type=="video")
-        mp4_aud_ok = any(s.codec_name in ("aac","mp3","ac3") for s in job.streams if s.codec_type=="audio")
+        mp4_vid_ok = any(s.codec_name in ("h264","mpeg4","mpeg2video","mpeg1video","hevc") for s in video_streams)
+        mp4_aud_ok = any(s.codec_name in ("aac","mp3","ac3") for s in audio_streams)
         target_ext = job.target_container
         if target_ext == "mp4" and not (mp4_vid_ok and mp4_aud_ok):
             # fallback to mkv to avoid forced transcode
@@ -185,6 +453,8 @@ class JobWorker(QtCore.QThread):
         else:
             unified_ext = target_ext
 
+        thr = ["-threads", str(self.threads)]
+
         try:
             if job.mode == "extract":
                 base = os.path.splitext(os.path.basename(job.input_path))[0]
@@ -192,59 +462,37 @@ class JobWorker(QtCore.QThread):
                 vid_idx = video_streams[0].index
 
                 if job.extract_variant == "sep_tracks":
-                    # write video-only mp4/mkv (remux)
+                    # one ffmpeg, one demux pass: video-only mp4/mkv + each audio + matched subs
                     out_video = os.path.join(job.out_dir, f"{base}.video.{unified_ext}")
-                    args_v = [FFMPEG,"-y","-i",job.input_path,"-map",f"0:{vid_idx}","-c","copy",out_video]
-                    ok = self._run_process_and_track(args_v, duration, "Extraindo vídeo")
-                    if not ok:
-                        self.finished.emit(False, "Falha ao extrair vídeo")
-                        return
-                    # extract each audio stream
+                    args = [FFMPEG,"-y","-i",job.input_path,"-map",f"0:{vid_idx}","-c","copy",*thr,*self._out(out_video)]
                     for idx, a in enumerate(audio_streams):
                         out_audio = os.path.join(job.out_dir, f"{base}.audio{idx+1}.mka")
-                        args_a = [FFMPEG,"-y","-i",job.input_path,"-map",f"0:{a.index}","-c","copy",out_audio]
-                        ok = self._run_process_and_track(args_a, duration, f"Extraindo áudio {idx+1}")
-                        if not ok:
-                            self.finished.emit(False, f"Falha ao extrair áudio {idx+1}")
-                            return
-                    # extract matched subtitles as srt
-                    s_count = 0
-                    for s in subtitle_streams:
-                        if self._match_sub_lang(s.language):
-                            out_s = os.path.join(job.out_dir, f"{base}.{s.language or 'sub'}.{s_count+1}.srt")
-                            args_s = [FFMPEG,"-y","-i",job.input_path,"-map",f"0:{s.index}","-c:s","srt",out_s]
-                            ok = self._run_process_and_track(args_s, duration, f"Extraindo legenda {s_count+1}")
-                            if not ok:
-                                self.finished.emit(False, f"Falha ao extrair legenda {s_count+1}")
-                                return
-                            s_count += 1
-                    self.finished.emit(True, "Extração (faixas separadas) concluída")
+                        args += ["-map",f"0:{a.index}","-c","copy",*thr,*self._out(out_audio)]
+                    sub_args, skipped = self._sub_outputs(base, subtitle_streams, thr)
+                    args += sub_args
+                    ok = self._run_process_and_track(args, duration, "Extraindo faixas")
+                    if not ok:
+                        self.signals.finished.emit(self.job_id, False, "Falha ao extrair faixas")
+                        return
+                    self.signals.finished.emit(self.job_id, True, "Extração (faixas separadas) concluída" + self._skipped_note(skipped))
                     return
 
                 elif job.extract_variant == "vid_aud__leg":
-                    # remux video + all audio into a single file (prefer mp4 if friendly)
+                    # remux video + all audio into a single file (prefer mp4 if friendly),
+                    # matched subtitles go to separate outputs of the same ffmpeg run
                     out_unified = os.path.join(job.out_dir, f"{base}.{unified_ext}")
-                    args = [FFMPEG,"-y","-i",job.input_path,"-c","copy"]
+                    args = [FFMPEG,"-y","-i",job.input_path]
                     args += ["-map", f"0:{vid_idx}"]
                     for a in audio_streams:
                         args += ["-map", f"0:{a.index}"]
-                    args += [out_unified]
-                    ok = self._run_process_and_track(args, duration, "Remux: vídeo+áudio")
+                    args += ["-c","copy",*thr,*self._out(out_unified)]
+                    sub_args, skipped = self._sub_outputs(base, subtitle_streams, thr)
+                    args += sub_args
+                    ok = self._run_process_and_track(args, duration, "Remux: vídeo+áudio+legendas")
                     if not ok:
-                        self.finished.emit(False, "Falha no remux vídeo+áudio")
+                        self.signals.finished.emit(self.job_id, False, "Falha no remux vídeo+áudio/legendas")
                         return
-                    # extract matching subtitles to srt
-                    s_count = 0
-                    for s in subtitle_streams:
-                        if self._match_sub_lang(s.language):
-                            out_s = os.path.join(job.out_dir, f"{base}.{s.language or 'sub'}.{s_count+1}.srt")
-                            args_s = [FFMPEG,"-y","-i",job.input_path,"-map",f"0:{s.index}","-c:s","srt",out_s]
-                            ok = self._run_process_and_track(args_s, duration, f"Extraindo legenda {s_count+1}")
-                            if not ok:
-                                self.finished.emit(False, f"Falha ao extrair legenda {s_count+1}")
-                                return
-                            s_count += 1
-                    self.finished.emit(True, "Remux + legendas concluído")
+                    self.signals.finished.emit(self.job_id, True, "Remux + legendas concluído" + self._skipped_note(skipped))
                     return
 
                 else:  # vid_aud_leg_unified
@@ -257,12 +505,12 @@ class JobWorker(QtCore.QThread):
                     for s in subtitle_streams:
                         if self._match_sub_lang(s.language):
                             args += ["-map", f"0:{s.index}"]
-                    args += [out_unified]
+                    args += [*thr,*self._out(out_unified)]
                     ok = self._run_process_and_track(args, duration, "Remux unificado (V/A/Leg)")
                     if not ok:
-                        self.finished.emit(False, "Falha no remux unificado")
+                        self.signals.finished.emit(self.job_id, False, "Falha no remux unificado")
                         return
-                    self.finished.emit(True, "Remux unificado concluído")
+                    self.signals.finished.emit(self.job_id, True, "Remux unificado concluído")
                     return
 
             else:
@@ -271,18 +519,130 @@ class JobWorker(QtCore.QThread):
                 out_file = os.path.join(job.out_dir, f"{base}.{job.target_container}")
                 vcodec = job.target_vcodec
                 acodec = job.target_acodec
-                args = [FFMPEG,"-y","-i",job.input_path,"-c:v",vcodec,"-crf",str(job.crf),"-preset","veryfast","-c:a",acodec,"-b:a",f"{job.abr_kbps}k",out_file]
-                ok = self._run_process_and_track(args, duration, "Transcodificando")
+                # streams already in the requested codec are copied, only the rest is transcoded
+                copy_v = all(encoder_codec(vcodec) == v.codec_name for v in video_streams)
+                copy_a = bool(audio_streams) and all(encoder_codec(acodec) == a.codec_name for a in audio_streams)
+                if copy_v:
+                    in_args, v_args = [], ["-c:v","copy"]
+                else:
+                    in_args, v_args = video_encode_args(vcodec, job.crf)
+                a_args = ["-c:a","copy"] if copy_a else ["-c:a",acodec,"-b:a",f"{job.abr_kbps}k"]
+                args = [FFMPEG,"-y",*in_args,"-i",job.input_path,*v_args,*a_args,*thr,*self._out(out_file)]
+                if copy_v and copy_a:
+                    step, done_msg = "Remux (codecs já no formato pedido)", "Remux concluído (reencode desnecessário)"
+                elif copy_v or copy_a:
+                    kept = "vídeo" if copy_v else "áudio"
+                    step, done_msg = f"Transcodificando ({kept} copiado)", f"Transcodificação concluída ({kept} copiado)"
+                else:
+                    step, done_msg = "Transcodificando", "Transcodificação concluída"
+                ok = self._run_process_and_track(args, duration, step)
                 if not ok:
-                    self.finished.emit(False, "Falha na transcodificação")
+                    self.signals.finished.emit(self.job_id, False, "Falha na transcodificação")
                     return
-                self.finished.emit(True, "Transcodificação concluída")
+                self.signals.finished.emit(self.job_id, True, done_msg)
                 return
 
         except Exception as e:
-            self.finished.emit(False, f"Erro interno: {e}")
+            self.signals.finished.emit(self.job_id, False, f"Erro interno: {e}")
             return
 
+# -------------------------
+# Queue model/view: cells are rendered on demand from MainWindow.jobs
+# -------------------------
+
+COL_SKIP, COL_PROGRESS, COL_MSG, COL_ACTIONS = 5, 6, 7, 8
+
+class JobTableModel(QtCore.QAbstractTableModel):
+    HEADERS = ["Arquivo","Status","VCodec/ACodec","Subs","Tamanho","Pular?","Progresso","Mensagem","Ações"]
+
+    def __init__(self, jobs: List[Job], parent=None):
+        super().__init__(parent)
+        self.jobs = jobs  # shared with MainWindow; rows are added/removed only through this model
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.jobs)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if role == QtCore.Qt.ItemDataRole.DisplayRole and orientation == QtCore.Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        job = self.jobs[index.row()]
+        col = index.column()
+        if role == QtCore.Qt.ItemDataRole.DisplayRole:
+            if col == 0: return os.path.basename(job.input_path)
+            if col == 1: return job.status
+            if col == 2: return f"{job.vcodecs_str}/{job.acodecs_str}"
+            if col == 3: return job.subs_str
+            if col == 4: return readable_size(job.filesize)
+            if col == COL_PROGRESS: return job.progress
+            if col == COL_MSG: return job.message
+            if col == COL_ACTIONS: return "Remover"
+        elif role == QtCore.Qt.ItemDataRole.CheckStateRole and col == COL_SKIP:
+            return QtCore.Qt.CheckState.Checked if job.skip_if_incompatible else QtCore.Qt.CheckState.Unchecked
+        return None
+
+    def flags(self, index):
+        f = super().flags(index)
+        if index.column() == COL_SKIP:
+            f |= QtCore.Qt.ItemFlag.ItemIsUserCheckable
+        return f
+
+    def setData(self, index, value, role=QtCore.Qt.ItemDataRole.EditRole):
+        if role == QtCore.Qt.ItemDataRole.CheckStateRole and index.column() == COL_SKIP:
+            self.jobs[index.row()].skip_if_incompatible = QtCore.Qt.CheckState(value) == QtCore.Qt.CheckState.Checked
+            self.dataChanged.emit(index, index, [role])
+            return True
+        return False
+
+    def refresh(self, row, first_col=0, last_col=COL_ACTIONS):
+        self.dataChanged.emit(self.index(row, first_col), self.index(row, last_col))
+
+    def append_jobs(self, jobs):
+        if not jobs:
+            return
+        start = len(self.jobs)
+        self.beginInsertRows(QtCore.QModelIndex(), start, start + len(jobs) - 1)
+        self.jobs.extend(jobs)
+        self.endInsertRows()
+
+    def remove_job(self, row):
+        self.beginRemoveRows(QtCore.QModelIndex(), row, row)
+        self.jobs.pop(row)
+        self.endRemoveRows()
+
+class JobDelegate(QtWidgets.QStyledItemDelegate):
+    # paints the progress bar and the remove button instead of one widget per row
+    def paint(self, painter, option, index):
+        col = index.column()
+        if col not in (COL_PROGRESS, COL_ACTIONS):
+            super().paint(painter, option, index)
+            return
+        widget = option.widget
+        style = widget.style() if widget else QtWidgets.QApplication.style()
+        enabled = QtWidgets.QStyle.StateFlag.State_Enabled
+        if col == COL_PROGRESS:
+            opt = QtWidgets.QStyleOptionProgressBar()
+            opt.rect = option.rect.adjusted(2, 2, -2, -2)
+            opt.minimum, opt.maximum = 0, 100
+            opt.progress = int(index.data() or 0)
+            opt.text = f"{opt.progress}%"
+            opt.textVisible = True
+            opt.state = enabled | QtWidgets.QStyle.StateFlag.State_Horizontal
+            style.drawControl(QtWidgets.QStyle.ControlElement.CE_ProgressBar, opt, painter, widget)
+        else:
+            opt = QtWidgets.QStyleOptionButton()
+            opt.rect = option.rect.adjusted(2, 2, -2, -2)
+            opt.text = index.data()
+            opt.state = enabled | QtWidgets.QStyle.StateFlag.State_Raised
+            style.drawControl(QtWidgets.QStyle.ControlElement.CE_PushButton, opt, painter, widget)
+
 # -------------------------
 # GUI main window
 # -------------------------
@@ -298,8 +658,14 @@ class MainWindow(QtWidgets.QMainWindow):
                 "ffmpeg e/ou ffprobe não foram encontrados no PATH. Instale-os antes de usar.")
 
         self.jobs: List[Job] = []
-        self.current_worker: Optional[JobWorker] = None
-        self.current_row: Optional[int] = None
+        # parallel queue: N runnables on a bounded pool, tracked by Job.job_id
+        self.concurrency = max(1, CPU_COUNT // 4)
+        self.pool = QtCore.QThreadPool()
+        self.pool.setMaxThreadCount(self.concurrency)
+        self.runners: Dict[int, JobRunnable] = {}
+        self._dispatching = False
+        self._probe_batch = []  # [(job, future)] while a folder is being probed
+        self._free_budget = None  # free bytes in the batch's out_dir minus what pending jobs will write
 
         self._build_ui()
 
@@ -363,6 +729,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.combo_container.addItems(["mp4","mkv","avi"])
         self.combo_vcodec = QtWidgets.QComboBox()
         self.combo_vcodec.addItems(["libx264","libx265","mpeg2video","mpeg1video"])
+        self.combo_vcodec.addItems(list(detect_encoders()))
         self.combo_acodec = QtWidgets.QComboBox()
         self.combo_acodec.addItems(["aac","ac3","mp3","libvorbis","libopus"])
         self.spin_crf = QtWidgets.QSpinBox(); self.spin_crf.setRange(10,51); self.spin_crf.setValue(20)
@@ -374,10 +741,20 @@ class MainWindow(QtWidgets.QMainWindow):
         re_layout.addWidget(QtWidgets.QLabel("Áudio kbps:"),4,0); re_layout.addWidget(self.spin_abr,4,1)
         v.addWidget(re_box)
 
+        # Parallelism
+        par = QtWidgets.QHBoxLayout()
+        self.spin_jobs = QtWidgets.QSpinBox(); self.spin_jobs.setRange(1, CPU_COUNT); self.spin_jobs.setValue(self.concurrency)
+        par.addWidget(QtWidgets.QLabel("Jobs simultâneos:")); par.addWidget(self.spin_jobs); par.addStretch()
+        v.addLayout(par)
+
         # Queue table
-        self.table = QtWidgets.QTableWidget(0,9)
-        self.table.setHorizontalHeaderLabels(["Arquivo","Status","VCodec/ACodec","Subs","Tamanho","Pular?","Progresso","Mensagem","Ações"])
+        self.model = JobTableModel(self.jobs, self)
+        self.table = QtWidgets.QTableView()
+        self.table.setModel(self.model)
+        self.table.setItemDelegate(JobDelegate(self.table))
+        self.table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectionBehavior.SelectRows)
         self.table.horizontalHeader().setSectionResizeMode(0, QtWidgets.QHeaderView.ResizeMode.Stretch)
+        self.table.clicked.connect(self._on_table_clicked)
         v.addWidget(self.table)
 
         # Buttons
@@ -395,6 +772,12 @@ class MainWindow(QtWidgets.QMainWindow):
         self.btn_start.clicked.connect(self.start_queue)
         self.btn_clear.clicked.connect(self.clear_done)
 
+    def closeEvent(self, event):
+        if _probe_cache is not None:
+            with _probe_cache_lock:
+                _probe_cache.sync()
+        super().closeEvent(event)
+
     def _pick_dir(self, widget):
         d = QtWidgets.QFileDialog.getExistingDirectory(self, "Escolher pasta")
         if d:
@@ -409,18 +792,33 @@ class MainWindow(QtWidgets.QMainWindow):
         return "vid_aud__leg"
 
     def add_from_input(self):
+        if self._probe_batch:
+            return  # previous folder still being probed
         in_dir = self.in_edit.text().strip()
         out_dir = self.out_edit.text().strip() or in_dir
         if not in_dir or not os.path.isdir(in_dir):
             QtWidgets.QMessageBox.warning(self, "Pasta inválida", "Selecione uma pasta de entrada válida.")
             return
-        files = [os.path.join(in_dir,f) for f in os.listdir(in_dir) if f.lower().endswith(('.mkv','.mp4','.avi','.mov','.ts','.m2ts'))]
-        if not files:
+        # scandir: file type comes from readdir and the one stat() per entry is cached
+        with os.scandir(in_dir) as it:
+            entries = [e for e in it if e.name.lower().endswith(('.mkv','.mp4','.avi','.mov','.ts','.m2ts')) and e.is_file()]
+        if not entries:
             QtWidgets.QMessageBox.information(self, "Nada", "Nenhum vídeo suportado encontrado.")
             return
-        for full in files:
-            # create job and probe
-            job = Job(input_path=full, out_dir=out_dir)
+        # free space of the destination, once per batch, minus what already-queued jobs will write there;
+        # _poll_probes spends it as jobs are accepted
+        try:
+            self._free_budget = shutil.disk_usage(out_dir).free - sum(
+                j.est_out_size for j in self.jobs if j.out_dir == out_dir and j.status in ("queued", "running"))
+        except Exception:
+            self._free_budget = None
+        # jobs take the current settings now; ffprobe results are filled in when they arrive
+        jobs = []
+        stats = []
+        for e in entries:
+            st = e.stat()
+            stats.append(st)
+            job = Job(input_path=e.path, out_dir=out_dir, filesize=st.st_size)
             job.mode = "extract" if self.rb_extract.isChecked() else "reencode"
             job.extract_variant = self._current_extract_variant()
             job.target_container = self.combo_container.currentText()
@@ -429,83 +827,84 @@ class MainWindow(QtWidgets.QMainWindow):
             job.crf = self.spin_crf.value()
             job.abr_kbps = self.spin_abr.value()
             job.lang_filters = self._gather_lang_filters()
+            job._lang_set = frozenset(t.lower() for lf in job.lang_filters for t in (lf, lf.split("-")[0]))
+            jobs.append(job)
 
-            streams, err = run_ffprobe_collect_streams(full)
-            if err or streams is None:
-                job.status = "incompatible"
-                job.message = f"ffprobe falhou: {err}"
-            else:
-                job.filesize = os.path.getsize(full)
-                job.duration = probe_duration(full)
-                for s in streams:
-                    idx = s.get("index")
-                    ctype = s.get("codec_type")
-                    cname = s.get("codec_name")
-                    tags = s.get("tags") or {}
-                    lang = tags.get("language") or tags.get("LANGUAGE")
-                    job.streams.append(StreamInfo(index=idx, codec_type=ctype, codec_name=cname, language=lang))
-                # basic check
-                if not any(s.codec_type=="video" for s in job.streams):
-                    job.status = "incompatible"
-                    job.message = "Sem faixa de vídeo"
-                else:
-                    job.status = "queued"
-            # check space in out_dir
-            try:
-                total, used, free = shutil.disk_usage(job.out_dir)
-                if free < job.filesize:
+        # probe in parallel off the GUI thread; a timer polls the futures
+        ex = ThreadPoolExecutor(max_workers=CPU_COUNT)
+        self._probe_batch = [(job, ex.submit(probe_file_cached, job.input_path, st)) for job, st in zip(jobs, stats)]
+        ex.shutdown(wait=False)
+        self.btn_add.setEnabled(False)
+        self._probe_dlg = QtWidgets.QProgressDialog("Analisando arquivos (ffprobe)...", None, 0, len(jobs), self)
+        self._probe_dlg.setWindowModality(QtCore.Qt.WindowModality.WindowModal)
+        self._probe_dlg.setMinimumDuration(300)
+        self._probe_timer = QtCore.QTimer(self)
+        self._probe_timer.timeout.connect(self._poll_probes)
+        self._probe_timer.start(50)
+
+    def _poll_probes(self):
+        done = sum(1 for _, fut in self._probe_batch if fut.done())
+        self._probe_dlg.setValue(done)
+        if done < len(self._probe_batch):
+            return
+        self._probe_timer.stop()
+        self._probe_timer.deleteLater()
+        self._probe_dlg.close()
+        batch, self._probe_batch = self._probe_batch, []
+        for job, fut in batch:
+            self._apply_probe(job, *fut.result())
+            job.est_out_size = estimate_out_size(job)
+            # check space in out_dir against the remaining budget
+            if self._free_budget is not None and job.status != "incompatible":
+                if job.est_out_size > self._free_budget:
                     job.status = "incompatible"
                     job.message = "Espaço insuficiente em destino"
-            except Exception:
-                pass
+                else:
+                    self._free_budget -= job.est_out_size
+        # one beginInsertRows/endInsertRows for the whole folder
+        self.model.append_jobs([job for job, _ in batch])
+        if not self._dispatching and not self.runners:
+            self.btn_add.setEnabled(True)
 
-            self.jobs.append(job)
-            self._append_job_row(job)
-
-    def _append_job_row(self, job: Job):
-        row = self.table.rowCount()
-        self.table.insertRow(row)
-        fname = os.path.basename(job.input_path)
-        self.table.setItem(row,0,QtWidgets.QTableWidgetItem(fname))
-        self.table.setItem(row,1,QtWidgets.QTableWidgetItem(job.status))
-        vcodecs = ",".join({s.codec_name for s in job.streams if s.codec_type=="video"})
-        acodecs = ",".join({s.codec_name for s in job.streams if s.codec_type=="audio"})
-        self.table.setItem(row,2,QtWidgets.QTableWidgetItem(f"{vcodecs}/{acodecs}"))
-        subs = ",".join([s.language or "" for s in job.streams if s.codec_type=="subtitle"])
-        self.table.setItem(row,3,QtWidgets.QTableWidgetItem(subs))
-        self.table.setItem(row,4,QtWidgets.QTableWidgetItem(readable_size(job.filesize)))
-        # skip checkbox
-        chk = QtWidgets.QCheckBox()
-        chk.setChecked(job.skip_if_incompatible)
-        chk.stateChanged.connect(lambda st, r=row: self._set_skip_flag(r, st))
-        self.table.setCellWidget(row,5,chk)
-        # progress bar
-        pbar = QtWidgets.QProgressBar()
-        pbar.setValue(0)
-        self.table.setCellWidget(row,6,pbar)
-        self.table.setItem(row,7,QtWidgets.QTableWidgetItem(job.message))
-        # actions (remove)
-        btn = QtWidgets.QPushButton("Remover")
-        btn.clicked.connect(lambda _, r=row: self._remove_row(r))
-        w = QtWidgets.QWidget()
-        lay = QtWidgets.QHBoxLayout(w); lay.setContentsMargins(0,0,0,0); lay.addWidget(btn); lay.addStretch()
-        self.table.setCellWidget(row,8,w)
-
-    def _set_skip_flag(self, row, state):
-        try:
-            self.jobs[row].skip_if_incompatible = bool(state)
-        except Exception:
-            pass
+    def _apply_probe(self, job, streams, duration, err):
+        if err or streams is None:
+            job.status = "incompatible"
+            job.message = f"ffprobe falhou: {err}"
+        else:
+            job.duration = duration
+            by_type = {"video": job.video_streams, "audio": job.audio_streams, "subtitle": job.subtitle_streams}
+            for st in streams:
+                lst = by_type.get(st.codec_type)
+                if lst is not None:
+                    lst.append(st)
+            # dict.fromkeys: de-duplicate codecs, keep stream order
+            job.vcodecs_str = ",".join(dict.fromkeys(st.codec_name or "" for st in job.video_streams))
+            job.acodecs_str = ",".join(dict.fromkeys(st.codec_name or "" for st in job.audio_streams))
+            job.subs_str = ",".join(st.language or "" for st in job.subtitle_streams)
+            # basic check
+            if not job.video_streams:
+                job.status = "incompatible"
+                job.message = "Sem faixa de vídeo"
+            else:
+                job.status = "queued"
+
+    def _on_table_clicked(self, index):
+        if index.column() == COL_ACTIONS:
+            self._remove_row(index.row())
 
     def _remove_row(self, row):
-        if self.current_row == row and self.current_worker and self.current_worker.isRunning():
+        if not 0 <= row < len(self.jobs):
+            return
+        if self.jobs[row].job_id in self.runners:
             QtWidgets.QMessageBox.warning(self, "Remover", "Não é possível remover item em execução.")
             return
-        try:
-            self.table.removeRow(row)
-            self.jobs.pop(row)
-        except Exception:
-            pass
+        self.model.remove_job(row)
+
+    def _row_of(self, job_id):
+        for r, job in enumerate(self.jobs):
+            if job.job_id == job_id:
+                return r
+        return None  # row was removed
 
     def remove_selected(self):
         sels = self.table.selectionModel().selectedRows()
@@ -514,15 +913,10 @@ class MainWindow(QtWidgets.QMainWindow):
             self._remove_row(r)
 
     def clear_done(self):
-        rows = []
-        for r in range(self.table.rowCount()):
-            it = self.table.item(r,1)
-            if it and it.text() in ("done","error","skipped"):
-                rows.append(r)
+        rows = [r for r, job in enumerate(self.jobs)
+                if job.status in ("done","error","skipped") and job.job_id not in self.runners]
         for r in reversed(rows):
-            self.table.removeRow(r)
-            try: self.jobs.pop(r)
-            except: pass
+            self.model.remove_job(r)
 
     def start_queue(self):
         if not self.jobs:
@@ -530,90 +924,84 @@ class MainWindow(QtWidgets.QMainWindow):
         # disable adding/removing while running optionally
         self.btn_add.setEnabled(False)
         self.btn_remove.setEnabled(False)
+        self.concurrency = self.spin_jobs.value()
+        self.pool.setMaxThreadCount(self.concurrency)
+        self._dispatching = True
         self.process_next()
 
     def process_next(self):
-        # if worker running, ignore
-        if self.current_worker and self.current_worker.isRunning():
-            return
-        next_idx = None
-        for idx, job in enumerate(self.jobs):
-            if job.status == "queued":
-                next_idx = idx; break
-            if job.status == "incompatible" and job.skip_if_incompatible:
-                job.status = "skipped"
-                self._update_row(idx)
-        if next_idx is None:
+        # start runnables until every pool slot is busy or nothing is left to start
+        while self._dispatching and len(self.runners) < self.concurrency:
+            next_idx = None
+            for idx, job in enumerate(self.jobs):
+                if job.status == "queued":
+                    next_idx = idx; break
+                if job.status == "incompatible" and job.skip_if_incompatible:
+                    job.status = "skipped"
+                    self._update_row(idx)
+            if next_idx is None:
+                # nothing left to start
+                self._dispatching = False
+                break
+            job = self.jobs[next_idx]
+            if job.status == "incompatible" and not job.skip_if_incompatible:
+                self._update_row(next_idx)
+                self._dispatching = False
+                QtWidgets.QMessageBox.warning(self, "Incompatível", f"Arquivo '{os.path.basename(job.input_path)}' incompatível:\\n{job.message}\\nMarque 'Pular' para ignorar ou remova o item.")
+                break
+            self._start_job(next_idx, job)
+
+        if not self._dispatching and not self.runners:
             # finished queue
             self.btn_add.setEnabled(True)
             self.btn_remove.setEnabled(True)
-            return
-        job = self.jobs[next_idx]
-        if job.status == "incompatible" and not job.skip_if_incompatible:
-            self._update_row(next_idx)
-            QtWidgets.QMessageBox.warning(self, "Incompatível", f"Arquivo '{os.path.basename(job.input_path)}' incompatível:\\n{job.message}\\nMarque 'Pular' para ignorar ou remova o item.")
-            self.btn_add.setEnabled(True)
-            self.btn_remove.setEnabled(True)
-            return
 
-        # start worker
-        self.current_row = next_idx
-        self.current_worker = JobWorker(job)
-        # connect signals
-        self.current_worker.progress.connect(lambda pct,msg: self._on_progress(self.current_row,pct,msg))
-        self.current_worker.status_changed.connect(lambda st: self._on_status(self.current_row,st))
-        self.current_worker.finished.connect(lambda ok,msg: self._on_finished(self.current_row,ok,msg))
+    def _start_job(self, row, job):
+        threads = max(1, CPU_COUNT // self.concurrency)
+        runner = JobRunnable(job, threads)
+        self.runners[job.job_id] = runner
+        # signals carry job_id; slots resolve the row on arrival, so removals in between are harmless
+        runner.signals.progress.connect(self._on_progress)
+        runner.signals.status_changed.connect(self._on_status)
+        runner.signals.finished.connect(self._on_finished)
         # update status
         job.status = "running"
-        self._update_row(next_idx)
-        self.current_worker.start()
-
-    def _on_progress(self, row, pct, msg):
-        try:
-            pbar = self.table.cellWidget(row,6)
-            if isinstance(pbar, QtWidgets.QProgressBar):
-                pbar.setValue(pct)
-            self.table.setItem(row,7,QtWidgets.QTableWidgetItem(msg))
-        except Exception:
-            pass
-
-    def _on_status(self, row, st):
-        try:
-            self.jobs[row].message = st
-            self.table.setItem(row,1,QtWidgets.QTableWidgetItem(self.jobs[row].status))
-            self.table.setItem(row,7,QtWidgets.QTableWidgetItem(st))
-        except Exception:
-            pass
+        self._update_row(row)
+        self.pool.start(runner)
 
-    def _on_finished(self, row, ok, msg):
-        try:
+    def _on_progress(self, job_id, pct, msg):
+        row = self._row_of(job_id)
+        if row is None: return
+        job = self.jobs[row]
+        job.progress = pct
+        if msg == job.message:
+            # usual tick: same step text, only the progress cell needs repainting
+            self.model.refresh(row, COL_PROGRESS, COL_PROGRESS)
+            return
+        job.message = msg
+        self.model.refresh(row, COL_PROGRESS, COL_MSG)
+
+    def _on_status(self, job_id, st):
+        row = self._row_of(job_id)
+        if row is None: return
+        self.jobs[row].message = st
+        self.model.refresh(row, 1, COL_MSG)
+
+    def _on_finished(self, job_id, ok, msg):
+        row = self._row_of(job_id)
+        if row is not None:
             self.jobs[row].status = "done" if ok else "error"
             self.jobs[row].message = msg
             self._update_row(row)
-        except Exception:
-            pass
-        # cleanup and process next
-        self.current_worker = None
-        self.current_row = None
+        # cleanup and fill the freed slot
+        self.runners.pop(job_id, None)
         QtCore.QTimer.singleShot(200, self.process_next)
 
     def _update_row(self, row):
         if row < 0 or row >= len(self.jobs): return
         job = self.jobs[row]
-        self.table.setItem(row,1,QtWidgets.QTableWidgetItem(job.status))
-        vcodecs = ",".join({s.codec_name for s in job.streams if s.codec_type=="video"})
-        acodecs = ",".join({s.codec_name for s in job.streams if s.codec_type=="audio"})
-        self.table.setItem(row,2,QtWidgets.QTableWidgetItem(f"{vcodecs}/{acodecs}"))
-        subs = ",".join([s.language or "" for s in job.streams if s.codec_type=="subtitle"])
-        self.table.setItem(row,3,QtWidgets.QTableWidgetItem(subs))
-        self.table.setItem(row,4,QtWidgets.QTableWidgetItem(readable_size(job.filesize)))
-        chk = self.table.cellWidget(row,5)
-        if isinstance(chk, QtWidgets.QCheckBox):
-            chk.setChecked(job.skip_if_incompatible)
-        pbar = self.table.cellWidget(row,6)
-        if isinstance(pbar, QtWidgets.QProgressBar):
-            if job.status == "done": pbar.setValue(100)
-        self.table.setItem(row,7,QtWidgets.QTableWidgetItem(job.message))
+        if job.status == "done": job.progress = 100
+        self.model.refresh(row)
 
 # -------------------------
 # Run
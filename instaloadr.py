@@ -1,90 +1,218 @@
 import sys
 import os
 import time
+import random
+import functools
 import sqlite3
+import pickle
+import threading
 from threading import Thread, Event
 from PyQt6 import QtWidgets, QtCore
 import instaloader
 
 # --- Configurações ---
 DB_FILE = "insta_downloader.db"
+# Perfis e última sessão, restaurados na próxima execução
+STATE_FILE = "insta_downloader_state.pkl"
 DOWNLOAD_PATH = "X:/Insta"
+# Intervalo aleatório entre posts (segundos); um intervalo fixo é fácil de detectar como bot
+POST_DELAY_MIN = 10
+POST_DELAY_MAX = 20
+# Linhas mantidas no log da janela (as mais antigas são descartadas)
+LOG_MAX_LINES = 5000
 # Pasta padrão onde o Instaloader salva sessions no Windows:
 DEFAULT_SESSION_DIR = os.path.join(os.path.expanduser("~"), "AppData", "Local", "Instaloader")
 
+# --- Sessions ---
+@functools.lru_cache(maxsize=8)
+def _list_sessions(dir_path, mtime_ns):
+    # mtime_ns entra só na chave do cache: criar/apagar arquivo muda o mtime da pasta e invalida
+    with os.scandir(dir_path) as it:
+        return tuple(e.name for e in it if e.name.startswith("session-") and e.is_file())
+
+def list_sessions(dir_path):
+    return _list_sessions(dir_path, os.stat(dir_path).st_mtime_ns)
+
 # --- Banco de dados (só posts baixados) ---
+class SqliteStore:
+    """Uma conexão só, aberta uma vez e compartilhada entre threads (protegida por lock)."""
+
+    def __init__(self, path):
+        self._lock = threading.Lock()
+        # isolation_level=None: transações explícitas; _flush_locked grava o lote pendente num BEGIN/COMMIT só
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn.execute('''CREATE TABLE IF NOT EXISTS downloaded_posts (
+                                id INTEGER PRIMARY KEY,
+                                profile TEXT,
+                                shortcode TEXT UNIQUE)''')
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_profile ON downloaded_posts(profile)")
+        self._cur = self._conn.cursor()
+        # marcações ainda não gravadas; vão para o banco em lote (um commit a cada FLUSH_EVERY)
+        self._pending = []
+
+    FLUSH_EVERY = 32
+
+    def is_downloaded(self, shortcode):
+        with self._lock:
+            if any(sc == shortcode for _, sc in self._pending):
+                return True
+            self._cur.execute("SELECT 1 FROM downloaded_posts WHERE shortcode=?", (shortcode,))
+            return self._cur.fetchone() is not None
+
+    def shortcodes_for(self, profile):
+        with self._lock:
+            self._cur.execute("SELECT shortcode FROM downloaded_posts WHERE profile=?", (profile,))
+            done = {row[0] for row in self._cur.fetchall()}
+            done.update(sc for p, sc in self._pending if p == profile)
+            return done
+
+    def mark(self, profile, shortcode):
+        with self._lock:
+            self._pending.append((profile, shortcode))
+            if len(self._pending) >= self.FLUSH_EVERY:
+                self._flush_locked()
+
+    def flush(self):
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        if not self._pending:
+            return
+        self._cur.execute("BEGIN")
+        try:
+            self._cur.executemany("INSERT OR IGNORE INTO downloaded_posts (profile, shortcode) VALUES (?, ?)", self._pending)
+        except Exception:
+            self._cur.execute("ROLLBACK")
+            raise
+        self._cur.execute("COMMIT")
+        self._pending.clear()
+
+    def close(self):
+        with self._lock:
+            self._flush_locked()
+            self._conn.close()
+
+_STORE = None
+
 def init_db():
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
-    cursor.execute('''CREATE TABLE IF NOT EXISTS downloaded_posts (
-                        id INTEGER PRIMARY KEY,
-                        profile TEXT,
-                        shortcode TEXT UNIQUE)''')
-    conn.commit()
-    conn.close()
+    global _STORE
+    if _STORE is None:
+        _STORE = SqliteStore(DB_FILE)
 
 def post_downloaded(shortcode):
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
-    cursor.execute("SELECT 1 FROM downloaded_posts WHERE shortcode=?", (shortcode,))
-    result = cursor.fetchone()
-    conn.close()
-    return result is not None
+    return _STORE.is_downloaded(shortcode)
+
+def downloaded_shortcodes(profile):
+    return _STORE.shortcodes_for(profile)
 
 def mark_post_downloaded(profile, shortcode):
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
-    cursor.execute("INSERT OR IGNORE INTO downloaded_posts (profile, shortcode) VALUES (?, ?)", (profile, shortcode))
-    conn.commit()
-    conn.close()
+    _STORE.mark(profile, shortcode)
+
+def flush_downloaded():
+    if _STORE is not None:
+        _STORE.flush()
+
+# --- Instaloader ---
+def is_video_post(post):
+    # Post._node (privado no Instaloader) é o nó da página da listagem e já traz is_video/__typename;
+    # post.is_video pode cair em _full_metadata e custar uma requisição GraphQL por post
+    node = getattr(post, "_node", None)
+    if isinstance(node, dict) and ("is_video" in node or "__typename" in node):
+        return bool(node.get("is_video")) or node.get("__typename") in ("GraphVideo", "XDTGraphVideo")
+    return post.is_video
 
 # --- Thread de download ---
 class DownloadThread(Thread):
-    def __init__(self, L, profile_name, pause_event, log_func, progress_func):
+    """Uma thread só para todos os perfis, um após o outro: o Instaloader (e o rate limit do
+    Instagram) vê um fluxo serial de requisições, em vez de várias threads disputando self.L."""
+
+    def __init__(self, L, profile_names, pause_event, resume_event, log_func, progress_func):
         super().__init__()
         self.L = L
-        self.profile_name = profile_name
-        self.pause_event = pause_event
+        self.profile_names = list(profile_names)
+        self.pause_event = pause_event  # set = pausado (acorda a espera entre posts)
+        self.resume_event = resume_event  # set = rodando (libera quem está pausado)
         self.log_func = log_func
         self.progress_func = progress_func
 
     def run(self):
+        for profile_name in self.profile_names:
+            self.log_func(f"Iniciando perfil {profile_name}")
+            self.download_profile(profile_name)
+        flush_downloaded()
+        self.log_func("Fila de perfis concluída.")
+
+    def download_profile(self, profile_name):
         try:
-            profile = instaloader.Profile.from_username(self.L.context, self.profile_name)
+            profile = instaloader.Profile.from_username(self.L.context, profile_name)
         except Exception as e:
-            self.log_func(f"Erro ao acessar perfil {self.profile_name}: {e}")
+            self.log_func(f"Erro ao acessar perfil {profile_name}: {e}")
             return
 
-        posts = list(profile.get_posts())
-        total = len(posts)
+        # get_posts() pagina sob demanda: o primeiro download começa com a primeira página,
+        # e listagem e downloads seguem na mesma thread, sem requisições concorrentes no contexto
+        # nem listagem correndo durante a pausa
+        posts = profile.get_posts()
+        # total exato só quando a listagem termina; até lá vale a contagem do perfil
+        try:
+            total = profile.mediacount
+        except Exception:
+            total = 0
         count = 0
         self.progress_func(0, total)
+        # um SELECT só para o perfil inteiro; depois a checagem é em memória
+        done = downloaded_shortcodes(profile_name)
 
-        for post in posts:
-            if post.is_video:
-                if post_downloaded(post.shortcode):
-                    self.log_func(f"[{self.profile_name}] Já baixado: {post.shortcode}")
-                    count += 1
+        try:
+            for post in posts:
+                count += 1
+                total = max(total, count)
+                # shortcode já vem na página da listagem: posts já baixados nem chegam a consultar is_video
+                if post.shortcode in done:
+                    self.log_func(f"[{profile_name}] Já baixado: {post.shortcode}")
                     self.progress_func(count, total)
                     continue
 
-                self.log_func(f"[{self.profile_name}] Baixando: {post.shortcode}")
-                try:
-                    # download_post cria a pasta DOWNLOAD_PATH/{profile_name}
-                    self.L.download_post(post, target=self.profile_name)
-                    mark_post_downloaded(self.profile_name, post.shortcode)
-                except Exception as e:
-                    self.log_func(f"[{self.profile_name}] Erro ao baixar: {e}")
-
-                count += 1
-                self.progress_func(count, total)
+                if is_video_post(post):
+                    self.log_func(f"[{profile_name}] Baixando: {post.shortcode}")
+                    try:
+                        # download_post cria a pasta DOWNLOAD_PATH/{profile_name}
+                        self.L.download_post(post, target=profile_name)
+                        mark_post_downloaded(profile_name, post.shortcode)
+                        done.add(post.shortcode)
+                    except Exception as e:
+                        self.log_func(f"[{profile_name}] Erro ao baixar: {e}")
 
-                # Pausa total ~2s (20 * 0.1s), mas respeita pausa do usuário
-                for _ in range(20):
-                    if self.pause_event.is_set():
-                        while self.pause_event.is_set():
-                            time.sleep(0.5)
-                    time.sleep(0.1)
+                    self.progress_func(count, total)
+                    self.wait_between_posts()
+                else:
+                    self.progress_func(count, total)
+        except Exception as e:
+            self.log_func(f"[{profile_name}] Erro ao listar posts: {e}")
+
+        self.progress_func(count, count)
+
+    def wait_between_posts(self):
+        # Espera aleatória entre posts sem polling: o wait acorda na hora se o usuário pausar,
+        # fica bloqueado até retomar e então recomeça um novo intervalo
+        deadline = time.monotonic() + random.uniform(POST_DELAY_MIN, POST_DELAY_MAX)
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            if self.pause_event.wait(remaining):
+                self.resume_event.wait()
+                deadline = time.monotonic() + random.uniform(POST_DELAY_MIN, POST_DELAY_MAX)
+
+# --- Sinais da thread para a UI ---
+class DownloadSignals(QtCore.QObject):
+    # emitidos da thread de download; entregues na thread da UI pela fila de eventos do Qt
+    log = QtCore.pyqtSignal(str)
+    progress = QtCore.pyqtSignal(int, int)  # valor, máximo
 
 # --- UI ---
 class InstaDownloader(QtWidgets.QWidget):
@@ -96,25 +224,41 @@ class InstaDownloader(QtWidgets.QWidget):
         # Instaloader - sem login aqui; carregaremos session file com load_session_from_file
         self.L = instaloader.Instaloader(dirname_pattern=f"{DOWNLOAD_PATH}/{{target}}",
                                          download_videos=True,
-                                         download_video_thumbnails=False)
+                                         download_video_thumbnails=False,
+                                         # só o vídeo: cada extra abaixo é mais requisição contra o limite do Instagram
+                                         download_geotags=False,
+                                         download_comments=False,
+                                         save_metadata=False,
+                                         compress_json=False,
+                                         post_metadata_txt_pattern="")
         self.session_loaded = False
         self.session_user = None
         self.session_path = None
 
         # estados
         self.profiles = []
-        self.threads = []
+        self.worker = None
         self.pause_event = Event()
+        self.resume_event = Event()
+        self.resume_event.set()
 
         # UI
         self.init_ui()
 
+        # a thread só emite; log e barra de progresso são atualizados aqui, na thread da UI
+        self.signals = DownloadSignals()
+        self.signals.log.connect(self.log_message, QtCore.Qt.ConnectionType.QueuedConnection)
+        self.signals.progress.connect(self.progress_update, QtCore.Qt.ConnectionType.QueuedConnection)
+
         # DB
         init_db()
 
         # tenta detectar sessions na pasta padrão
         self.detect_sessions_in_default_dir()
 
+        # perfis e sessão da última execução
+        self.restore_state()
+
     def init_ui(self):
         layout = QtWidgets.QVBoxLayout()
 
@@ -173,8 +317,9 @@ class InstaDownloader(QtWidgets.QWidget):
         layout.addWidget(self.progress_bar)
 
         # --- Log ---
-        self.log = QtWidgets.QTextEdit()
+        self.log = QtWidgets.QPlainTextEdit()
         self.log.setReadOnly(True)
+        self.log.setMaximumBlockCount(LOG_MAX_LINES)
         layout.addWidget(QtWidgets.QLabel("Log detalhado:"))
         layout.addWidget(self.log)
 
@@ -188,6 +333,36 @@ class InstaDownloader(QtWidgets.QWidget):
 
         self.setLayout(layout)
 
+    def closeEvent(self, event):
+        # grava as marcações pendentes do lote atual antes de sair
+        flush_downloaded()
+        self.save_state()
+        super().closeEvent(event)
+
+    # ---------- estado entre execuções ----------
+    def restore_state(self):
+        try:
+            with open(STATE_FILE, "rb") as f:
+                state = pickle.load(f)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            self.log_message(f"Não foi possível ler {STATE_FILE}: {e}")
+            return
+        self.profiles = list(state.get("profiles", []))
+        self.profiles_list.addItems(self.profiles)
+        session_path = state.get("session_path")
+        if session_path and os.path.isfile(session_path):
+            self.load_session_from_path(session_path)
+
+    def save_state(self):
+        state = {"profiles": self.profiles, "session_path": self.session_path}
+        try:
+            with open(STATE_FILE, "wb") as f:
+                pickle.dump(state, f)
+        except Exception as e:
+            self.log_message(f"Não foi possível salvar {STATE_FILE}: {e}")
+
     # ---------- sessões ----------
     def detect_sessions_in_default_dir(self):
         self.sessions_list.clear()
@@ -195,15 +370,17 @@ class InstaDownloader(QtWidgets.QWidget):
             self.log_message(f"Pasta padrão de sessions não encontrada: {DEFAULT_SESSION_DIR}")
             return
 
-        files = os.listdir(DEFAULT_SESSION_DIR)
-        sessions = [f for f in files if f.startswith("session-")]
+        sessions = list_sessions(DEFAULT_SESSION_DIR)
         if not sessions:
             self.log_message(f"Nenhuma session encontrada em {DEFAULT_SESSION_DIR}")
             return
 
-        for s in sessions:
-            item = QtWidgets.QListWidgetItem(s)
-            self.sessions_list.addItem(item)
+        # inserção em bloco: um único relayout em vez de um por item
+        self.sessions_list.setUpdatesEnabled(False)
+        try:
+            self.sessions_list.addItems(sessions)
+        finally:
+            self.sessions_list.setUpdatesEnabled(True)
         self.log_message(f"Encontradas {len(sessions)} session(s) em {DEFAULT_SESSION_DIR}")
 
     def select_session_file(self):
@@ -264,8 +441,7 @@ class InstaDownloader(QtWidgets.QWidget):
     # ---------- progresso / log ----------
     def log_message(self, msg):
         timestamp = QtCore.QDateTime.currentDateTime().toString("yyyy-MM-dd HH:mm:ss")
-        self.log.append(f"[{timestamp}] {msg}")
-        QtWidgets.QApplication.processEvents()
+        self.log.appendPlainText(f"[{timestamp}] {msg}")
 
     def progress_update(self, value, maximum):
         self.progress_bar.setMaximum(maximum)
@@ -279,25 +455,29 @@ class InstaDownloader(QtWidgets.QWidget):
         if not self.profiles:
             QtWidgets.QMessageBox.warning(self, "Sem perfis", "Adicione ao menos um perfil alvo.")
             return
+        if self.worker is not None and self.worker.is_alive():
+            self.log_message("Download já em andamento.")
+            return
 
         # reset progress bar
         self.progress_bar.setValue(0)
         self.pause_event.clear()
-        self.threads = []
+        self.resume_event.set()
 
-        # inicia uma thread por perfil (threads controladas, cada thread serializa seus próprios downloads)
-        for profile_name in self.profiles:
-            thread = DownloadThread(self.L, profile_name, self.pause_event, self.log_message, self.progress_update)
-            thread.start()
-            self.threads.append(thread)
-            self.log_message(f"Thread iniciada para {profile_name}")
+        # uma única thread percorre os perfis em sequência (requisições serializadas no mesmo self.L)
+        self.worker = DownloadThread(self.L, self.profiles, self.pause_event, self.resume_event,
+                                     self.signals.log.emit, self.signals.progress.emit)
+        self.worker.start()
+        self.log_message(f"Download iniciado para {len(self.profiles)} perfil(is)")
 
     def pause_download(self):
+        self.resume_event.clear()
         self.pause_event.set()
         self.log_message("Download pausado pelo usuário.")
 
     def resume_download(self):
         self.pause_event.clear()
+        self.resume_event.set()
         self.log_message("Download retomado pelo usuário.")
 
 # --- Main ---